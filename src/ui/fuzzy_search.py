@@ -1,13 +1,68 @@
 from __future__ import annotations
 from tkinter import StringVar, Widget, Listbox, END, SINGLE, Event, Menu
 from tkinter.ttk import Frame, Entry, Style, Scrollbar
-from typing import Optional, List, Callable, Any
+from typing import Optional, List, Callable, Any, Sequence
 from difflib import SequenceMatcher
 from pathlib import Path
 from openpyxl import load_workbook
 import os
 import subprocess
 
+def _similarity(a: str, b: str) -> float:
+    """Get the similarity of two strings on a 0-100 scale.
+
+    search_threshold and the match bonuses are tuned for SequenceMatcher's
+    ratio. rapidfuzz's ratio is a different (Indel-based) metric, so it is
+    not used as a drop-in replacement.
+    """
+    return SequenceMatcher(None, a, b).ratio() * 100
+
+
+def _rank_matches(
+    search_lower: str,
+    values: Sequence[str],
+    lower_values: Sequence[str],
+    threshold: float,
+) -> List[str]:
+    """Get the values matching a search, best match first.
+
+    Args:
+        search_lower: The lowercase search text
+        values: The searchable values
+        lower_values: The lowercase forms of ``values``
+        threshold: Minimum score (0-100) a value needs to be listed
+
+    Returns:
+        List[str]: Matching values sorted by score, ties in list order
+    """
+    search_len = len(search_lower)
+    scored_matches: List[tuple[float, str]] = []
+
+    for value, value_lower in zip(values, lower_values):
+        # Apply bonuses for special matches
+        if value_lower == search_lower:  # Exact match
+            ratio = 100
+        elif value_lower.startswith(search_lower):  # Prefix match
+            ratio = max(_similarity(search_lower, value_lower), 90)
+        elif search_lower in value_lower:  # Contains match
+            ratio = max(_similarity(search_lower, value_lower), 80)
+        elif any(word.startswith(search_lower) for word in value_lower.split()):  # Word boundary match
+            ratio = max(_similarity(search_lower, value_lower), 75)
+        else:
+            # The similarity is at most 200 * shorter / (sum of lengths),
+            # so values too short or too long to reach it are not scored
+            value_len = len(value_lower)
+            if 200 * min(search_len, value_len) < threshold * (search_len + value_len):
+                continue
+            ratio = _similarity(search_lower, value_lower)
+
+        # Only include matches that meet the threshold
+        if ratio >= threshold:
+            scored_matches.append((ratio, value))
+
+    # Sort by score (highest first); the sort is stable so ties keep list order
+    scored_matches.sort(reverse=True, key=lambda x: x[0])
+    return [value for _, value in scored_matches]
 
 
 class FuzzySearchFrame(Frame):
@@ -24,7 +79,11 @@ class FuzzySearchFrame(Frame):
     ) -> None:
         super().__init__(master, **kwargs)
 
-        self.all_values = [str(v) for v in (values or []) if v is not None]
+        self._store_values(values)
+        # Last values passed in and the entry text the listbox was built for,
+        # so setting the same cached values again can be skipped
+        self._values_source: Optional[Sequence[str]] = None
+        self._listbox_query: Optional[str] = None
         self.search_threshold = max(
             0, min(100, search_threshold)
         )  # Clamp between 0 and 100
@@ -158,13 +217,27 @@ class FuzzySearchFrame(Frame):
         if not self.entry.get():
             self._set_placeholder()
 
-    def set_values(self, values: Optional[List[str]]) -> None:
-        """Update the list of searchable values."""
-        self.all_values = [str(v) for v in (values or []) if v is not None]
+    def set_values(self, values: Optional[Sequence[str]]) -> None:
+        """Update the list of searchable values.
+
+        Passing the same values object again (e.g. a cached tuple) is a no-op
+        while the listbox still matches the entry text.
+        """
+        if values is not None and values is self._values_source:
+            if self.get() == self._listbox_query:
+                return
+        else:
+            self._values_source = values
+            self._store_values(values)
         current_value = self.get()  # Use existing get() method which handles placeholder
         self.set(current_value)  # Use existing set() method which handles placeholder
         self._update_listbox()
 
+    def _store_values(self, values: Optional[Sequence[str]]) -> None:
+        """Keep the searchable values along with their lowercase forms."""
+        self.all_values = [str(v) for v in (values or []) if v is not None]
+        self._lower_values = [value.lower() for value in self.all_values]
+
     def get(self) -> str:
         """Get the current entry text, excluding placeholder."""
         value = self.entry.get()
@@ -191,52 +264,39 @@ class FuzzySearchFrame(Frame):
     def _update_listbox(self) -> None:
         """Update the listbox with intelligent fuzzy search results."""
         current_value = self.get()  # Use get() to handle placeholder properly
+        self._listbox_query = current_value
 
         # Clear current listbox
         self.listbox.delete(0, END)
 
-        # If empty, show all values
+        # If empty, show all values (one Tcl call for the whole list)
         if not current_value:
-            for value in self.all_values:
-                self.listbox.insert(END, value)
+            if self.all_values:
+                self.listbox.insert(END, *self.all_values)
             return
 
         try:
-            search_lower = current_value.lower()
-            scored_matches: List[tuple[float, str]] = []
-
-            for value in self.all_values:
-                value_lower = value.lower()
-                
-                # Calculate ratio using SequenceMatcher
-                ratio = SequenceMatcher(None, search_lower, value_lower).ratio() * 100
-                
-                # Apply bonuses for special matches
-                if value_lower == search_lower:  # Exact match
-                    ratio = 100
-                elif value_lower.startswith(search_lower):  # Prefix match
-                    ratio = max(ratio, 90)
-                elif search_lower in value_lower:  # Contains match
-                    ratio = max(ratio, 80)
-                elif any(word.startswith(search_lower) for word in value_lower.split()):  # Word boundary match
-                    ratio = max(ratio, 75)
-                
-                # Only include matches that meet the threshold
-                if ratio >= self.search_threshold:
-                    scored_matches.append((ratio, value))
-
-            # Sort by score (highest first) and add to listbox
-            scored_matches.sort(reverse=True, key=lambda x: x[0])
-            
-            for _, value in scored_matches:
-                self.listbox.insert(END, value)
+            matches = _rank_matches(
+                current_value.lower(),
+                self.all_values,
+                self._lower_values,
+                self.search_threshold,
+            )
+            if matches:
+                self.listbox.insert(END, *matches)
 
         except Exception as e:
             print(f"Error in fuzzy search ({self.identifier}): {str(e)}")
             # Fall back to simple contains matching
-            for value in self.all_values:
-                if current_value.lower() in value.lower():
-                    self.listbox.insert(END, value)
+            self.listbox.delete(0, END)
+            search_lower = current_value.lower()
+            matches = [
+                value
+                for value, value_lower in zip(self.all_values, self._lower_values)
+                if search_lower in value_lower
+            ]
+            if matches:
+                self.listbox.insert(END, *matches)
 
     def _on_select(self, event: Optional[Event] = None) -> None:
         """Handle selection events in the listbox."""
@@ -331,6 +391,19 @@ class FuzzySearchFrame(Frame):
         self.entry.delete(0, END)
         self._set_placeholder()
         self.listbox.delete(0, END)
+        self._listbox_query = None
+
+    def reset(self, values: Optional[Sequence[str]] = ()) -> None:
+        """Clear the entry and replace the searchable values in a single pass."""
+        if values is None or values is not self._values_source:
+            self._values_source = values
+            self._store_values(values)
+        self.entry.delete(0, END)
+        self._set_placeholder()
+        self.listbox.delete(0, END)
+        if self.all_values:
+            self.listbox.insert(END, *self.all_values)
+        self._listbox_query = ""
 
     def _show_context_menu(self, event: Event) -> None:
         """Show the context menu on right-click."""
@@ -374,7 +447,7 @@ class FuzzySearchFrame(Frame):
                 print(f"[DEBUG] Invalid row index from value: {value}")
                 return
 
-            config = processing_tab.config_manager.get_config()
+            config = processing_tab.get_config_snapshot()
             excel_file = config.get("excel_file", "")
             sheet_name = config.get("excel_sheet", "")
             filter2_col = config.get("filter2_column", "")
@@ -4,15 +4,33 @@ from tkinter import (
     Canvas as TkCanvas,
     Label as TkLabel,
     Widget as TkWidget,
+    TclError,
 )
 from tkinter.ttk import (
     Frame as ttkFrame,
     Scrollbar as ttkScrollbar,
 )
 from PIL.ImageTk import PhotoImage as PILPhotoImage
+from PIL.Image import Resampling, Transpose
 from typing import Optional, Any, Dict
+from functools import lru_cache
+from os import path
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import RLock
 from .error_dialog import ErrorDialog
 
+# Bitmap transposes matching render_pdf_page's rotation matrix, which turns
+# the page counterclockwise by the rotation angle
+_ROTATION_TRANSPOSES = {
+    90: Transpose.ROTATE_90,
+    180: Transpose.ROTATE_180,
+    270: Transpose.ROTATE_270,
+}
+
+# Zoom of the cached page rasters; smaller zoom levels are downscaled from
+# these and larger ones are rendered at their own zoom, so nothing is upscaled
+_BASE_ZOOM = 2.0
+
 
 class PDFViewer(ttkFrame):
     """A modernized PDF viewer widget with zoom and scroll capabilities."""
@@ -22,9 +40,29 @@ class PDFViewer(ttkFrame):
         self.pdf_manager = pdf_manager
         self.current_images: Dict[int, PILPhotoImage] = {}  # Store images for each page
         self.current_pdf: Optional[str] = None
+        self._current_mtime: Optional[float] = None
         self.zoom_level = 1.25
         self.total_pages = 0
         self.page_spacing = 20  # Spacing between pages in pixels
+        self._last_canvas_size = (0, 0)  # Canvas size at the last resize
+        self._content_size = (0, 0)  # Width/height needed by the drawn pages
+
+        # Pages are rendered on a single background worker; only the newest
+        # request is applied and the fitz document is used under a lock
+        self._render_lock = RLock()
+        self._render_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pdf-render"
+        )
+        self._render_seq = 0  # Bumped to make in-flight document renders stale
+        self._document_future: Optional[Future] = None
+        self._rotation_future: Optional[Future] = None
+        self._pending_zoom_id: Optional[str] = None  # Wheel zoom waiting to redraw
+        self._loading_label: Optional[TkLabel] = None
+        # Page rasters memoized per viewer (a method-level lru_cache would be
+        # shared by all viewers and keep them alive); emptied by clear/destroy
+        self._render_cached = lru_cache(maxsize=32)(self._render_page)
+        self.bind("<<DocumentRendered>>", self._apply_document)
+        self.bind("<<RotationRendered>>", self._apply_rotation)
 
         # Configure grid weights
         self.grid_columnconfigure(0, weight=1)
@@ -117,10 +155,7 @@ class PDFViewer(ttkFrame):
 
         def _on_mousewheel(event: TkEvent) -> None:
             if event.state & 4:  # Ctrl key
-                if event.delta > 0:
-                    self.zoom_in()
-                else:
-                    self.zoom_out()
+                self._queue_zoom(0.2 if event.delta > 0 else -0.2)
             else:
                 self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
@@ -181,10 +216,23 @@ class PDFViewer(ttkFrame):
             self.canvas.yview_moveto(1)
 
     def _on_resize(self, event: TkEvent) -> None:
-        """Handle window resize events."""
-        if event.widget == self.canvas:
+        """Handle window resize events.
+
+        Pages are only redrawn when the canvas width changes, since that is
+        all the centering depends on; height changes just adjust the scroll
+        region.
+        """
+        if event.widget != self.canvas:
+            return
+        size = (event.width, event.height)
+        if size == self._last_canvas_size:
+            return
+        width_changed = size[0] != self._last_canvas_size[0]
+        self._last_canvas_size = size
+        if width_changed:
             self._center_images()
-            self._update_scrollbar_visibility()
+        else:
+            self._update_scroll_region()
 
     def _center_images(self) -> None:
         """Center all PDF pages horizontally and stack them vertically in the canvas."""
@@ -224,8 +272,16 @@ class PDFViewer(ttkFrame):
                 total_height += image_height + self.page_spacing
 
         # Set scroll region to accommodate all pages
-        scroll_width = max(canvas_width, max_image_width + 40)  # Add padding
-        scroll_height = max(self.canvas.winfo_height(), total_height)
+        self._content_size = (max_image_width + 40, total_height)  # Add padding
+        self._update_scroll_region()
+
+    def _update_scroll_region(self) -> None:
+        """Fit the scroll region to the drawn pages and the canvas size."""
+        if not self.current_images:
+            return
+        content_width, content_height = self._content_size
+        scroll_width = max(self.canvas.winfo_width(), content_width)
+        scroll_height = max(self.canvas.winfo_height(), content_height)
         self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
 
         # Update scrollbar visibility
@@ -234,49 +290,259 @@ class PDFViewer(ttkFrame):
     def display_pdf(
         self, pdf_path: str, zoom: float = 1.0, show_loading: bool = True
     ) -> None:
-        """Display all pages of a PDF file with the specified zoom level."""
+        """Display all pages of a PDF file with the specified zoom level.
+
+        The pages are rendered on a background worker and shown once they are
+        all ready; the previous document stays on screen until then. A newer
+        call supersedes a render that has not finished yet.
+        """
+        self.current_pdf = pdf_path
+        self.zoom_level = zoom
+        self._cancel_renders()
+        if self._pending_zoom_id is not None:
+            self.after_cancel(self._pending_zoom_id)
+            self._pending_zoom_id = None
+
         try:
-            self.current_pdf = pdf_path
-            self.zoom_level = zoom
-            self.current_images.clear()
-
-            # Show loading message
-            loading_label = None
-            if show_loading:
-                loading_label = TkLabel(
-                    self.loading_frame, text="Loading PDF...", font=("Segoe UI", 10)
-                )
-                loading_label.pack(pady=20)
-                self.loading_frame.lift()
-                self.update()
+            mtime = self._current_mtime = path.getmtime(pdf_path)
+        except OSError as e:
+            self._hide_loading()
+            ErrorDialog(self, "Error", f"Error displaying PDF: {str(e)}")
+            return
 
-            # Get total pages and render each page
-            self.total_pages = self.pdf_manager.get_pdf_page_count(pdf_path)
-            for page_num in range(1, self.total_pages + 1):
-                image = self.pdf_manager.render_pdf_page(pdf_path, zoom=zoom, page=page_num)
-                self.current_images[page_num] = PILPhotoImage(image)
+        if show_loading:
+            self._show_loading()
+
+        future = self._render_executor.submit(
+            self._render_document,
+            self._render_seq,
+            pdf_path,
+            mtime,
+            zoom,
+            self.pdf_manager.get_rotation(),
+        )
+        self._document_future = future
+        future.add_done_callback(self._post_document_rendered)
+
+    def clear(self) -> None:
+        """Remove the displayed PDF and stop any render still in progress.
+
+        Once this returns the worker no longer touches the PDF manager's
+        document, so callers may close it and move the file.
+        """
+        self.current_pdf = None
+        self._cancel_renders()
+        # Wait for a page render already holding the document to finish
+        with self._render_lock:
+            pass
+        self._hide_loading()
+        self._render_cached.cache_clear()
+        self.current_images.clear()
+        self.total_pages = 0
+        self.canvas.delete("all")
+        self._update_scrollbar_visibility()
 
-            if loading_label:
-                loading_label.destroy()
-                self.loading_frame.place_forget()
+    def destroy(self) -> None:
+        """Stop the render worker before the widget goes away."""
+        self._cancel_renders()
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+        self._render_cached.cache_clear()
+        super().destroy()
+
+    def _cancel_renders(self) -> None:
+        """Make pending document and rotation renders stale."""
+        self._render_seq += 1
+        if self._document_future is not None:
+            self._document_future.cancel()
+            self._document_future = None
+        self._cancel_rotation()
+
+    def _show_loading(self) -> None:
+        """Show the loading message over the canvas."""
+        if self._loading_label is None:
+            self._loading_label = TkLabel(
+                self.loading_frame, text="Loading PDF...", font=("Segoe UI", 10)
+            )
+            self._loading_label.pack(pady=20)
+        self.loading_frame.place(relx=0.5, rely=0.5, anchor="center")
+        self.loading_frame.lift()
+
+    def _hide_loading(self) -> None:
+        """Remove the loading message, if shown."""
+        if self._loading_label is not None:
+            self._loading_label.destroy()
+            self._loading_label = None
+            self.loading_frame.place_forget()
+
+    def _render_document(
+        self, seq: int, pdf_path: str, mtime: float, zoom: float, rotation: int
+    ) -> Optional[list]:
+        """Render every page of a PDF (worker thread).
+
+        Returns:
+            Optional[list]: PIL images in page order, or None if a newer
+            request made this render stale
+        """
+        with self._render_lock:
+            if seq != self._render_seq:
+                return None
+            total_pages = self.pdf_manager.get_pdf_page_count(pdf_path)
+
+        pages = []
+        for page_num in range(1, total_pages + 1):
+            with self._render_lock:
+                if seq != self._render_seq:
+                    return None
+                pages.append(
+                    self._scaled_page(pdf_path, mtime, zoom, page_num, rotation)
+                )
+        return pages
 
+    def _post_document_rendered(self, future: Future) -> None:
+        """Wake the Tk thread once a document render finished (worker thread)."""
+        if future.cancelled():
+            return
+        try:
+            self.event_generate("<<DocumentRendered>>", when="tail")
+        except (RuntimeError, TclError) as e:
+            # Main loop not running (e.g. during shutdown)
+            print(f"[DEBUG] Could not post rendered PDF: {str(e)}")
+
+    def _apply_document(self, event: Optional[TkEvent] = None) -> None:
+        """Show the newest finished document render."""
+        future = self._document_future
+        if future is None or not future.done():
+            return  # Stale event, or the newest render is still running
+        self._document_future = None
+        self._hide_loading()
+        try:
+            pages = future.result()
+            if pages is None:
+                return
+            self.current_images = {
+                page_num: PILPhotoImage(image)
+                for page_num, image in enumerate(pages, start=1)
+            }
+            self.total_pages = len(pages)
             self._center_images()
             self.canvas.focus_set()
+        except Exception as e:
+            ErrorDialog(self, "Error", f"Error displaying PDF: {str(e)}")
+
+    def _render_page(
+        self, pdf_path: str, mtime: float, zoom: float, page: int, rotation: int
+    ) -> Any:
+        """Render a page; called through the per-viewer _render_cached.
+
+        Results are memoized per file version, zoom, page and rotation, and
+        ``mtime`` is only part of the cache key. A rotated first page is made
+        by turning the cached unrotated bitmap instead of rasterizing again.
+        """
+        if page == 1 and rotation in _ROTATION_TRANSPOSES:
+            base = self._render_cached(pdf_path, mtime, zoom, page, 0)
+            return base.transpose(_ROTATION_TRANSPOSES[rotation])
+        with self._render_lock:
+            return self.pdf_manager.render_pdf_page(
+                pdf_path, zoom=zoom, page=page, rotation=0
+            )
+
+    def _scaled_page(
+        self, pdf_path: str, mtime: float, zoom: float, page: int, rotation: int
+    ) -> Any:
+        """Get a page at ``zoom`` from its cached raster.
+
+        Zoom levels up to the base zoom resize one raster per page and
+        rotation, so zoom steps are a resample instead of a fitz render.
+        Above it the page is rendered at ``zoom`` itself to stay sharp.
+        """
+        base_zoom = max(_BASE_ZOOM, zoom)
+        base = self._render_cached(pdf_path, mtime, base_zoom, page, rotation)
+        if zoom == base_zoom:
+            return base
+        scale = zoom / base_zoom
+        size = (max(1, round(base.width * scale)), max(1, round(base.height * scale)))
+        return base.resize(size, Resampling.LANCZOS)
+
+    def show_rotation(self) -> None:
+        """Redraw the first page at the PDF manager's current rotation.
+
+        The rotated page is rendered on a background worker and swapped in on
+        the Tk thread. Only the first page is rotated, so the other pages are
+        left as is.
+        """
+        if not self.current_pdf:
+            return
+        if self._document_future is not None:
+            # The document is still loading; restart it at the new rotation
+            self.display_pdf(self.current_pdf, self.zoom_level, show_loading=False)
+            return
+        if 1 not in self.current_images:
+            return
 
+        # A newer rotation supersedes any render still waiting to run
+        self._cancel_rotation()
+        future = self._render_executor.submit(
+            self._scaled_page,
+            self.current_pdf,
+            self._current_mtime,
+            self.zoom_level,
+            1,
+            self.pdf_manager.get_rotation(),
+        )
+        self._rotation_future = future
+        future.add_done_callback(self._post_rotation_rendered)
+
+    def _cancel_rotation(self) -> None:
+        """Drop the pending rotation render, if any."""
+        if self._rotation_future is not None:
+            self._rotation_future.cancel()
+            self._rotation_future = None
+
+    def _post_rotation_rendered(self, future: Future) -> None:
+        """Wake the Tk thread once a rotation render finished (worker thread)."""
+        if future.cancelled():
+            return
+        try:
+            self.event_generate("<<RotationRendered>>", when="tail")
+        except (RuntimeError, TclError) as e:
+            # Main loop not running (e.g. during shutdown)
+            print(f"[DEBUG] Could not post rotated page: {str(e)}")
+
+    def _apply_rotation(self, event: Optional[TkEvent] = None) -> None:
+        """Show the newest finished rotation render."""
+        future = self._rotation_future
+        if future is None or not future.done():
+            return  # Stale event, or the newest render is still running
+        self._rotation_future = None
+        try:
+            self.current_images[1] = PILPhotoImage(future.result())
+            self._center_images()
         except Exception as e:
-            if loading_label:
-                loading_label.destroy()
-                self.loading_frame.place_forget()
             ErrorDialog(self, "Error", f"Error displaying PDF: {str(e)}")
 
+    def _queue_zoom(self, step: float) -> None:
+        """Adjust the zoom level now and redraw once a wheel burst settles."""
+        if not self.current_pdf:
+            return
+        self.zoom_level = round(min(3.0, max(0.2, self.zoom_level + step)), 2)
+        if self._pending_zoom_id is None:
+            self._pending_zoom_id = self.after(50, self._apply_zoom)
+
+    def _apply_zoom(self) -> None:
+        """Redraw the PDF at the zoom level reached by the wheel burst."""
+        self._pending_zoom_id = None
+        if self.current_pdf:
+            self.display_pdf(self.current_pdf, self.zoom_level, show_loading=False)
+
     def zoom_in(self, step: float = 0.2) -> None:
         """Zoom in all PDF pages."""
         if self.current_pdf:
-            self.zoom_level = min(3.0, self.zoom_level + step)
+            # Rounded so repeated steps map back onto the same cache keys
+            self.zoom_level = round(min(3.0, self.zoom_level + step), 2)
             self.display_pdf(self.current_pdf, self.zoom_level, show_loading=False)
 
     def zoom_out(self, step: float = 0.2) -> None:
         """Zoom out all PDF pages."""
         if self.current_pdf:
-            self.zoom_level = max(0.2, self.zoom_level - step)
+            self.zoom_level = round(max(0.2, self.zoom_level - step), 2)
             self.display_pdf(self.current_pdf, self.zoom_level, show_loading=False)
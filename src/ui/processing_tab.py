@@ -2,6 +2,7 @@ from __future__ import annotations
 from tkinter import (
     Event as TkEvent,
     Widget as TkWidget,
+    TclError,
     filedialog,
 )
 from tkinter.ttk import (
@@ -12,10 +13,15 @@ from tkinter.ttk import (
     LabelFrame,
 )
 
-from os import path, makedirs, remove
+from os import path, makedirs, remove, cpu_count
+from functools import lru_cache
 from shutil import copy2
-from typing import Optional, Dict, List, Callable
-from threading import Thread, Lock, Event
+from typing import Any, Optional, Dict, List, Mapping, Tuple, Callable
+from types import MappingProxyType
+from threading import Thread, Lock, Event, Timer
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from queue import Queue, Empty
 from .fuzzy_search import FuzzySearchFrame
 from .error_dialog import ErrorDialog
 from datetime import datetime
@@ -25,6 +31,90 @@ from .queue_display import QueueDisplay
 from .pdf_viewer import PDFViewer
 import traceback
 import time
+import re
+
+# Matches formatted filter2 values such as "value ⟨Excel Row: N⟩"
+_FILTER2_RE = re.compile(r"(.*?)\s*⟨Excel Row:\s*(\d+)⟩")
+
+# Date layouts accepted for DATE columns, most common first
+DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%Y/%m/%d")
+
+# Format that last parsed a value, per (excel_file, sheet, column)
+_LAST_DATE_FORMAT: Dict[tuple[str, str, str], str] = {}
+
+# ExcelManager attributes holding the loaded sheet and its hyperlink cache,
+# copied between managers when a background reload is swapped in
+_EXCEL_STATE_ATTRS = (
+    "excel_data",
+    "_cached_file",
+    "_cached_sheet",
+    "_last_modified",
+    "_hyperlink_cache",
+    "_last_cached_key",
+)
+
+
+def _parse_date_string(value: str, key: tuple[str, str, str]) -> Optional[datetime]:
+    """Parse a date string, trying the format that last worked for ``key`` first.
+
+    Args:
+        value: The stripped date string
+        key: (excel_file, sheet, column) the value comes from
+
+    Returns:
+        Optional[datetime]: The parsed date, or None if no layout matched
+    """
+    last_format = _LAST_DATE_FORMAT.get(key)
+    formats = DATE_FORMATS
+    if last_format is not None:
+        formats = (last_format,) + tuple(f for f in DATE_FORMATS if f != last_format)
+
+    for date_format in formats:
+        try:
+            parsed_date = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        _LAST_DATE_FORMAT[key] = date_format
+        return parsed_date
+    return None
+
+
+def _format_filter_values(series: pd.Series, is_date_column: bool) -> Tuple[str, ...]:
+    """Get the sorted, display-formatted distinct values of a column.
+
+    Args:
+        series: The column values
+        is_date_column: Whether to show the values as dd/mm/yyyy dates
+
+    Returns:
+        Tuple[str, ...]: The sorted distinct values
+    """
+    # Series.unique keeps datetimes as Timestamps (pd.unique on the raw array
+    # would give numpy.datetime64) and deduplicates category codes
+    uniques = series.unique()
+
+    if not is_date_column:
+        # Stringify and strip the distinct values in one vectorized pass
+        filter_values = (
+            pd.Series(uniques, dtype=object).astype(str).str.strip().tolist()
+        )
+    else:
+        filter_values = []
+        for value in uniques:
+            if pd.notnull(value) and isinstance(value, datetime):
+                formatted_value = value.strftime("%d/%m/%Y")
+            elif pd.notnull(value):
+                # Try parsing as date if it's not already a datetime
+                try:
+                    parsed_date = datetime.strptime(str(value).strip(), "%d/%m/%Y")
+                    formatted_value = parsed_date.strftime("%d/%m/%Y")
+                except ValueError:
+                    formatted_value = str(value).strip()
+            else:
+                continue
+            filter_values.append(formatted_value)
+
+    return tuple(sorted(filter_values))
 
 
 # Queue Management
@@ -34,22 +124,112 @@ class ProcessingQueue:
         config_manager: ConfigManager,
         excel_manager: ExcelManager,
         pdf_manager: PDFManager,
+        max_workers: Optional[int] = None,
+        excel_factory: Optional[Callable[[], ExcelManager]] = None,
     ):
         self.tasks: Dict[str, PDFTask] = {}
+        # Tasks indexed by status, kept in step with self.tasks by _set_status
+        self._buckets: Dict[str, Dict[str, PDFTask]] = {
+            status: {}
+            for status in (
+                "pending",
+                "processing",
+                "failed",
+                "link_failed",
+                "completed",
+                "reverted",
+                "skipped",
+            )
+        }
         self.lock = Lock()
-        self.processing_thread: Optional[Thread] = None
+        if max_workers is None:
+            max_workers = min(4, cpu_count() or 1)
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._active_workers = 0
+        self._worker_futures: List[Future] = []  # Joined by stop() before the final flush
+        self._stop_timeout = 10.0  # Longest the final flush waits for running tasks
+        self._pending: Queue[Optional[PDFTask]] = Queue()  # Feed of tasks for the workers
+        self._excel_lock = Lock()  # Serializes workbook reads/writes across workers
+        self._output_lock = Lock()  # Serializes output path generation and moves
+        # Worker-side Excel managers keyed by (excel_file, sheet) so a batch of
+        # tasks reuses one parsed workbook instead of reloading it per task
+        self._excel_cache: Dict[tuple[str, str], ExcelManager] = {}
+        # Builds the worker-side managers; override to inject a lighter reader
+        self._excel_factory: Callable[[], ExcelManager] = excel_factory or (
+            lambda: type(excel_manager)()
+        )
+        # Hyperlink writes waiting to be saved together, guarded by self.lock
+        self._pending_excel_writes: List[
+            tuple[PDFTask, str, tuple[str, str, str]]
+        ] = []
+        self._excel_flush_timer: Optional[Timer] = None
+        self._excel_flush_delay = 2.0  # Longest a finished task waits for its write
+        self._flush_lock = Lock()  # Held for a whole flush so stop() can wait on it
+        # Link writes that failed after the PDF was moved, keyed by task path;
+        # retry_failed re-queues only the write for these, never the move
+        self._failed_excel_writes: Dict[
+            str, tuple[PDFTask, str, tuple[str, str, str]]
+        ] = {}
+        # Rows linked by the workers, applied to the UI's ExcelManager on the
+        # UI thread by drain_hyperlink_updates; guarded by self.lock
+        self._hyperlink_updates: List[tuple[str, str, int]] = []
         self.has_changes = False
-        self.notification_lock = Lock()  # Separate lock for notifications
-        try:
-            self.stop_event = Event()
-        except (AttributeError, RuntimeError):
-            self.stop_event = Event()
+        # Paths whose rows must be redrawn (None marks a removed task), guarded
+        # by self.lock; pending/processing rows are refreshed by the display anyway
+        self._changes: Dict[str, Optional[PDFTask]] = {}
+        self._dirty = Event()  # Set by workers; callbacks run later on the UI thread
+        self._change_notifier: Optional[Callable[[], None]] = None
+        self.stop_event = Event()
 
         self.config_manager = config_manager
         self.excel_manager = excel_manager
         self.pdf_manager = pdf_manager
         self._callbacks: List[Callable] = []
 
+        # Config snapshot shared by the workers, dropped whenever the config changes
+        self._config_snapshot: Optional[Dict[str, str]] = None
+        self.config_manager.add_change_callback(self._invalidate_config)
+
+        # Pre-generated task IDs so UUID generation stays off the UI thread
+        self._id_pool: deque[str] = deque()
+        self._id_pool_size = 64
+        self._id_refill_thread: Optional[Thread] = None
+        self._refill_id_pool()
+
+    def _refill_id_pool(self) -> None:
+        """Top up the task ID pool on a background thread if not already running."""
+        if self._id_refill_thread is not None and self._id_refill_thread.is_alive():
+            return
+
+        def refill() -> None:
+            while len(self._id_pool) < self._id_pool_size:
+                self._id_pool.append(PDFTask.generate_id())
+
+        self._id_refill_thread = Thread(target=refill, daemon=True)
+        self._id_refill_thread.start()
+
+    def _next_task_id(self) -> str:
+        """Take a task ID from the pool, falling back to generating one inline."""
+        try:
+            task_id = self._id_pool.popleft()
+        except IndexError:
+            task_id = PDFTask.generate_id()
+        if len(self._id_pool) < self._id_pool_size // 2:
+            self._refill_id_pool()
+        return task_id
+
+    def _invalidate_config(self) -> None:
+        """Drop the config snapshot so the next task re-reads the config."""
+        self._config_snapshot = None
+
+    def _get_config(self) -> Dict[str, str]:
+        """Get the config snapshot, taking a fresh one after a config change."""
+        config = self._config_snapshot
+        if config is None:
+            config = self._config_snapshot = self.config_manager.get_config()
+        return config
+
     def _parse_filter2_value(self, formatted_value: str) -> tuple[str, int]:
         """Parse filter2 value to get original value and row number.
 
@@ -62,8 +242,6 @@ class ProcessingQueue:
         Returns:
             tuple[str, int]: (original value without formatting, 0-based row index)
         """
-        import re
-
         if not formatted_value:
             print("[DEBUG] UI received empty filter2 value")
             return "", -1
@@ -71,7 +249,7 @@ class ProcessingQueue:
         # Remove checkmark if present
         formatted_value = formatted_value.replace("✓ ", "", 1)
 
-        match = re.match(r"(.*?)\s*⟨Excel Row:\s*(\d+)⟩", formatted_value)
+        match = _FILTER2_RE.match(formatted_value)
         if match:
             value = match.group(1).strip()
             row_num = int(match.group(2))
@@ -90,13 +268,58 @@ class ProcessingQueue:
         self._notify_status_change()
 
     def _notify_status_change(self) -> None:
-        """Notify callbacks of status changes without holding the main lock."""
-        with self.notification_lock:  # Use separate lock for notifications
-            for callback in self._callbacks:
-                try:
-                    callback()
-                except Exception as e:
-                    print(f"[DEBUG] Callback error: {str(e)}")
+        """Flag a status change; callbacks run from run_status_callbacks.
+
+        Worker threads only set the flag, so bursts of changes are coalesced
+        into one callback pass and Tk is never touched off the UI thread. The
+        change notifier is only woken when the flag goes from clear to set.
+        """
+        if self._dirty.is_set():
+            return
+        self._dirty.set()
+        if self._change_notifier is not None:
+            self._change_notifier()
+
+    def set_change_notifier(self, notifier: Optional[Callable[[], None]]) -> None:
+        """Set a thread-safe hook used to wake the UI when the queue changes."""
+        self._change_notifier = notifier
+
+    def has_active_tasks(self) -> bool:
+        """Return whether any task is pending or processing."""
+        with self.lock:
+            return bool(self._buckets["pending"] or self._buckets["processing"])
+
+    def _store_task(self, task: PDFTask) -> None:
+        """Add a task to the queue, replacing any task for the same PDF.
+
+        Must be called with self.lock held.
+        """
+        previous = self.tasks.get(task.pdf_path)
+        if previous is not None:
+            self._buckets[previous.status].pop(previous.pdf_path, None)
+        self.tasks[task.pdf_path] = task
+        self._buckets.setdefault(task.status, {})[task.pdf_path] = task
+
+    def _set_status(self, task: PDFTask, new_status: str) -> None:
+        """Change a task's status and move it to the matching bucket.
+
+        Must be called with self.lock held.
+        """
+        if self.tasks.get(task.pdf_path) is task:
+            self._buckets[task.status].pop(task.pdf_path, None)
+            self._buckets.setdefault(new_status, {})[task.pdf_path] = task
+        task.status = new_status
+
+    def run_status_callbacks(self) -> None:
+        """Run the status change callbacks. Must be called from the UI thread.
+
+        Only the UI thread touches the callback list, so no lock is taken.
+        """
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[DEBUG] Callback error: {str(e)}")
 
     def update_task_status(self, task_id: str, new_status: str) -> None:
         """Update a task's status in a thread-safe way."""
@@ -105,11 +328,12 @@ class ProcessingQueue:
             # Find task by ID
             for task in self.tasks.values():
                 if task.task_id == task_id:
-                    task.status = new_status
+                    self._set_status(task, new_status)
                     # Set end time when task is completed or failed
                     if new_status in ["completed", "failed"]:
                         task.end_time = datetime.now()
                     task_to_update = task
+                    self._changes[task.pdf_path] = task
                     self.has_changes = True
                     break
 
@@ -126,88 +350,318 @@ class ProcessingQueue:
         return None
 
     def add_task(self, task: PDFTask) -> None:
+        if not task.task_id:
+            task.task_id = self._next_task_id()
         with self.lock:
-            self.tasks[task.pdf_path] = task
+            self._store_task(task)
+            self._changes[task.pdf_path] = task
+        self._pending.put(task)
         self.mark_changed()
         self._ensure_processing()
 
     def clear_completed(self) -> None:
         """Clear completed tasks from the queue."""
         with self.lock:
-            self.tasks = {
-                k: v for k, v in self.tasks.items() if v.status != "completed"
-            }
+            completed, self._buckets["completed"] = self._buckets["completed"], {}
+            for k in completed:
+                del self.tasks[k]
+                self._changes[k] = None
         self.mark_changed()
 
     def retry_failed(self) -> None:
         """Retry failed tasks in the queue."""
         with self.lock:
-            for task in self.tasks.values():
-                if task.status == "failed":
-                    task.status = "pending"
-                    task.error_msg = ""
+            failed, self._buckets["failed"] = self._buckets["failed"], {}
+            for task in failed.values():
+                task.status = "pending"
+                task.error_msg = ""
+                self._changes[task.pdf_path] = task
+            self._buckets["pending"].update(failed)
+
+            # These PDFs were already moved, so only their hyperlink is rewritten
+            link_failed = self._buckets["link_failed"]
+            self._buckets["link_failed"] = {}
+            failed_writes = [
+                self._failed_excel_writes.pop(task_path)
+                for task_path in link_failed
+                if task_path in self._failed_excel_writes
+            ]
+            for task in link_failed.values():
+                task.status = "processing"
+                task.error_msg = ""
+                self._changes[task.pdf_path] = task
+            self._buckets["processing"].update(link_failed)
+        # Feed the workers outside the lock; they re-check the status anyway
+        for task in failed.values():
+            self._pending.put(task)
+        for task, output_path, (excel_file, sheet_name, filter2_column) in failed_writes:
+            self._queue_excel_link(
+                task, output_path, excel_file, sheet_name, filter2_column
+            )
         self.mark_changed()
         self._ensure_processing()
 
     def _ensure_processing(self) -> None:
-        if self.processing_thread is None or not self.processing_thread.is_alive():
-            self.stop_event.clear()
-            self.processing_thread = Thread(target=self._process_queue, daemon=True)
-            self.processing_thread.start()
+        """Start enough workers on the pool to cover the pending tasks."""
+        with self.lock:
+            if self._executor is None:
+                self.stop_event.clear()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="pdf-worker"
+                )
+            wanted = min(self.max_workers, self._pending.qsize())
+            self._worker_futures = [f for f in self._worker_futures if not f.done()]
+            while self._active_workers < wanted:
+                self._active_workers += 1
+                self._worker_futures.append(self._executor.submit(self._process_queue))
 
     def get_task_status(self) -> Dict[str, List[PDFTask]]:
         with self.lock:
-            result = {
-                "pending": [],
-                "processing": [],
-                "failed": [],
-                "completed": [],
-                "reverted": [],
-                "skipped": [],  # Add skipped status to tracking
+            return {
+                status: list(bucket.values())
+                for status, bucket in self._buckets.items()
             }
-            for task in self.tasks.values():
-                if task.status in result:
-                    result[task.status].append(task)
-            return result
+
+    def get_status_counts(self) -> tuple[int, Dict[str, int]]:
+        """Get the number of tasks in the queue and in each status.
+
+        Returns:
+            tuple[int, Dict[str, int]]: Total task count and per-status counts
+        """
+        with self.lock:
+            return len(self.tasks), {
+                status: len(bucket) for status, bucket in self._buckets.items()
+            }
+
+    def drain_hyperlink_updates(self) -> List[tuple[str, str, int]]:
+        """Take the rows the workers linked since the last call.
+
+        Returns:
+            List[tuple[str, str, int]]: (excel_file, sheet_name, row_idx) for
+            each written hyperlink
+        """
+        with self.lock:
+            updates, self._hyperlink_updates = self._hyperlink_updates, []
+        return updates
+
+    def drain_changes(self) -> Dict[str, Optional[PDFTask]]:
+        """Take the tasks added, removed or moved out of a finished state.
+
+        Returns:
+            Dict[str, Optional[PDFTask]]: Changed paths mapped to their task, or
+            None for tasks that left the queue
+        """
+        with self.lock:
+            changes, self._changes = self._changes, {}
+        return changes
 
     def check_and_clear_changes(self) -> bool:
         """Check if there are changes and clear the flag. Returns whether there were changes."""
         with self.lock:
-            had_changes = self.has_changes
+            had_changes = self.has_changes or self._dirty.is_set()
             self.has_changes = False
+            self._dirty.clear()
             return had_changes
 
     def stop(self) -> None:
+        """Signal the workers to stop and return without waiting for them.
+
+        Joining the workers and writing the hyperlinks they left queued runs
+        on a separate thread, as the caller is usually the UI thread and a
+        worker may be waiting on it to post a queue change. That thread is
+        not a daemon, so the interpreter only exits once the links are saved.
+        """
         self.stop_event.set()
-        if self.processing_thread:
-            self.processing_thread.join(timeout=1)
+        self._change_notifier = None
+        with self.lock:
+            for _ in range(self._active_workers):
+                self._pending.put(None)  # Wake idle workers so they exit
+            executor, self._executor = self._executor, None
+            futures, self._worker_futures = self._worker_futures, []
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        Thread(
+            target=self._finish_stop, args=(futures,), name="pdf-queue-stop"
+        ).start()
+
+    def _finish_stop(self, futures: List[Future]) -> None:
+        """Wait for the stopped workers, then write their queued hyperlinks."""
+        _, not_done = wait(futures, timeout=self._stop_timeout)
+        if not_done:
+            print(f"[DEBUG] {len(not_done)} worker(s) still running at shutdown")
+        # Waits for a timer flush already in progress, then writes the rest
+        self._flush_excel_writes()
 
     def _process_queue(self) -> None:
+        """Worker loop: take pending tasks off the feed until idle or stopped."""
         while not self.stop_event.is_set():
-            task_to_process = None
+            try:
+                task_to_process = self._pending.get(timeout=1)
+            except Empty:
+                with self.lock:
+                    # Retire only if nothing was queued since the timeout
+                    if self._pending.empty():
+                        self._active_workers -= 1
+                        return
+                continue
+
+            if task_to_process is None:  # Stop sentinel
+                break
 
             with self.lock:
-                for task in self.tasks.values():
-                    if task.status == "pending":
-                        task.status = "processing"
-                        task_to_process = task
-                        self.has_changes = True  # Set flag when status changes
-                        self._notify_status_change()
-                        break
+                # Skip entries that were superseded or already picked up
+                if (
+                    self.tasks.get(task_to_process.pdf_path) is not task_to_process
+                    or task_to_process.status != "pending"
+                ):
+                    continue
+                self._set_status(task_to_process, "processing")
+                self.has_changes = True  # Set flag when status changes
+            self._notify_status_change()
+
+            self._process_task(task_to_process)
 
-            if task_to_process is None:
-                self.stop_event.wait(0.1)
+            # Nothing else queued, so write the collected hyperlinks now
+            if self._pending.empty():
+                self._flush_excel_writes()
+
+        with self.lock:
+            self._active_workers -= 1
+
+    def _get_excel_manager(self, excel_file: str, sheet_name: str) -> ExcelManager:
+        """Return the cached worker-side ExcelManager for a workbook sheet.
+
+        The manager's own modification-time check decides when the sheet is
+        reparsed; switching to another workbook or sheet evicts the old entry.
+        """
+        key = (excel_file, sheet_name)
+        with self.lock:
+            excel_manager = self._excel_cache.get(key)
+            if excel_manager is None:
+                self._excel_cache.clear()
+                excel_manager = self._excel_factory()
+                self._excel_cache[key] = excel_manager
+            return excel_manager
+
+    @staticmethod
+    def _parse_date_columns(df: pd.DataFrame) -> None:
+        """Convert text DATE columns to datetimes in one vectorized pass.
+
+        A column is only converted when every non-empty cell matches one of
+        DATE_FORMATS, so tasks get Timestamps instead of parsing their own
+        cell. Other columns are left as they are for the per-value parsing.
+        """
+        for column in df.columns:
+            if "DATE" not in str(column).upper() or df[column].dtype != object:
                 continue
+            values = df[column].dropna().astype(str).str.strip()
+            for date_format in DATE_FORMATS:
+                try:
+                    parsed = pd.to_datetime(values, format=date_format, errors="raise")
+                except (ValueError, TypeError):
+                    continue
+                df[column] = parsed.reindex(df.index)
+                break
 
+    def _queue_excel_link(
+        self,
+        task: PDFTask,
+        output_path: str,
+        excel_file: str,
+        sheet_name: str,
+        filter2_column: str,
+    ) -> None:
+        """Queue a processed task's hyperlink for the next batched workbook save."""
+        with self.lock:
+            self._pending_excel_writes.append(
+                (task, output_path, (excel_file, sheet_name, filter2_column))
+            )
+            if self._excel_flush_timer is None:
+                self._excel_flush_timer = Timer(
+                    self._excel_flush_delay, self._flush_excel_writes
+                )
+                self._excel_flush_timer.daemon = True
+                self._excel_flush_timer.start()
+
+    def _flush_excel_writes(self) -> None:
+        """Write all queued hyperlinks, loading and saving each workbook once."""
+        with self._flush_lock:
+            changed = self._write_excel_links()
+        # Notify outside the locks; the notifier may block on the UI thread
+        if changed:
+            self._notify_status_change()
+
+    def _write_excel_links(self) -> bool:
+        """Write the queued hyperlinks. Must be called with _flush_lock held.
+
+        Returns:
+            bool: Whether any task changed status
+        """
+        with self.lock:
+            writes, self._pending_excel_writes = self._pending_excel_writes, []
+            if self._excel_flush_timer is not None:
+                self._excel_flush_timer.cancel()
+                self._excel_flush_timer = None
+        if not writes:
+            return False
+
+        batches: Dict[tuple[str, str, str], List[tuple[PDFTask, str]]] = {}
+        for task, output_path, key in writes:
+            batches.setdefault(key, []).append((task, output_path))
+
+        for key, entries in batches.items():
+            excel_file, sheet_name, filter2_column = key
+            tasks = [task for task, _ in entries]
             try:
-                config = self.config_manager.get_config()
-                excel_manager = self.excel_manager
+                with self._excel_lock:
+                    excel_manager = self._get_excel_manager(excel_file, sheet_name)
+                    original_hyperlinks = excel_manager.apply_pdf_link_batch(
+                        excel_file,
+                        sheet_name,
+                        filter2_column,
+                        [(task.row_idx, output_path) for task, output_path in entries],
+                    )
+                with self.lock:
+                    for task, original_hyperlink in zip(tasks, original_hyperlinks):
+                        task.original_excel_hyperlink = original_hyperlink
+                        self._set_status(task, "completed")
+                        # The UI's hyperlink markers are updated on the UI thread
+                        self._hyperlink_updates.append(
+                            (excel_file, sheet_name, task.row_idx)
+                        )
+                    self.has_changes = True  # Set flag when status changes
+            except Exception as e:
+                with self.lock:
+                    for task, output_path in entries:
+                        # The PDF is already moved, so only the link is retried
+                        self._set_status(task, "link_failed")
+                        task.error_msg = f"PDF moved but Excel link not written: {str(e)}"
+                        self._failed_excel_writes[task.pdf_path] = (
+                            task,
+                            output_path,
+                            key,
+                        )
+                    self.has_changes = True  # Set flag when status changes
+                print(f"[DEBUG] Excel link batch failed: {str(e)}")
+        return True
 
-                # Load Excel data
-                excel_manager.load_excel_data(
+    def _process_task(self, task_to_process: PDFTask) -> None:
+        """Process a single task that has been marked as processing."""
+        queued_for_excel = False
+        try:
+            # Excel reads and writes share one workbook, so they run one task at a time
+            with self._excel_lock:
+                config = self._get_config()
+                excel_manager = self._get_excel_manager(
                     config["excel_file"], config["excel_sheet"]
                 )
 
+                # Load Excel data, parsing text date columns once per reload
+                if excel_manager.load_excel_data(
+                    config["excel_file"], config["excel_sheet"]
+                ):
+                    self._parse_date_columns(excel_manager.excel_data)
+
                 # Get filter columns dynamically based on the number of filter values
                 filter_columns = []
                 for i in range(1, len(task_to_process.filter_values) + 1):
@@ -266,31 +720,35 @@ class ProcessingQueue:
                                     f"[DEBUG] Row {row_idx} data doesn't match filter values"
                                 )
                                 print(f"[DEBUG] Mismatches: {mismatched_filters}")
-                                task_to_process.status = "failed"
+                                with self.lock:
+                                    self._set_status(task_to_process, "failed")
                                 task_to_process.error_msg = f"Selected row data doesn't match filter values: {', '.join(mismatched_filters)}"
                                 self.mark_changed()
-                                continue
+                                return
 
                         else:
                             print(
                                 f"[DEBUG] Row index {row_idx} is out of range (max: {len(excel_manager.excel_data) - 1})"
                             )
-                            task_to_process.status = "failed"
+                            with self.lock:
+                                self._set_status(task_to_process, "failed")
                             task_to_process.error_msg = f"Invalid Excel row number {row_idx + 2} (exceeds file length)"
                             self.mark_changed()
-                            continue
+                            return
                     else:
                         print("[DEBUG] Invalid row index extracted from filter2 value")
-                        task_to_process.status = "failed"
+                        with self.lock:
+                            self._set_status(task_to_process, "failed")
                         task_to_process.error_msg = "Could not extract valid Excel row number from filter2 value"
                         self.mark_changed()
-                        continue
+                        return
                 else:
                     print("[DEBUG] No filter2 value available")
-                    task_to_process.status = "failed"
+                    with self.lock:
+                        self._set_status(task_to_process, "failed")
                     task_to_process.error_msg = "Missing filter2 value with row number"
                     self.mark_changed()
-                    continue
+                    return
 
                 # Update task with the row index
                 task_to_process.row_idx = row_idx
@@ -298,9 +756,6 @@ class ProcessingQueue:
                     f"[DEBUG] Using row index: {row_idx} with filter columns: {filter_columns}"
                 )
 
-                # Define date formats as a constant
-                DATE_FORMATS = ["%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%Y/%m/%d"]
-
                 # Process all columns in one pass
                 template_data = {}
 
@@ -317,22 +772,17 @@ class ProcessingQueue:
 
                     # Handle any column that might contain dates
                     if "DATE" in column.upper():
-                        if pd.isnull(value):
-                            template_data[column] = None
-                        elif isinstance(value, datetime):
+                        # Excel usually hands back datetimes already (NaT excluded)
+                        if isinstance(value, datetime) and value is not pd.NaT:
                             template_data[column] = value
+                        elif pd.isnull(value):
+                            template_data[column] = None
                         else:
                             # Try to parse the date string
-                            parsed_date = None
-                            for date_format in DATE_FORMATS:
-                                try:
-                                    parsed_date = datetime.strptime(
-                                        str(value).strip(), date_format
-                                    )
-                                    break
-                                except ValueError:
-                                    continue
-
+                            parsed_date = _parse_date_string(
+                                str(value).strip(),
+                                (config["excel_file"], config["excel_sheet"], column),
+                            )
                             if parsed_date is None:
                                 raise ValueError(
                                     f"Could not parse date '{value}' in column '{column}'"
@@ -347,67 +797,76 @@ class ProcessingQueue:
                     if "DATE" in col.upper():
                         print(f"[DEBUG] {col}: {val} (type: {type(val)})")
 
-                # Add processed_folder to template data and process PDF
-                template_data["processed_folder"] = config["processed_folder"]
-                processed_path = self.pdf_manager.generate_output_path(
-                    config["output_template"], template_data
-                )
-
-                # Capture the original hyperlink before updating
-                original_hyperlink = self.excel_manager.update_pdf_link(
-                    config["excel_file"],
-                    config["excel_sheet"],
-                    task_to_process.row_idx,
-                    processed_path,
-                    config["filter2_column"],
-                )
-
-                # Assign the captured original hyperlink to the task
-                task_to_process.original_excel_hyperlink = original_hyperlink
-
                 # Assign the original PDF location
                 task_to_process.original_pdf_location = task_to_process.pdf_path
 
+            # Output path generation and the move are serialized to avoid name clashes
+            with self._output_lock:
                 # Continue with processing...
-                self.pdf_manager.process_pdf(
+                output_path = self.pdf_manager.process_pdf(
                     task_to_process,
                     template_data,
                     config["processed_folder"],
                     config["output_template"],
                 )
 
-                # Update task status to completed
-                with self.lock:
-                    task_to_process.status = "completed"
-                    self.has_changes = True  # Set flag when status changes
-                    self._notify_status_change()
+            # The task completes once its hyperlink is written by the batch flush
+            self._queue_excel_link(
+                task_to_process,
+                output_path,
+                config["excel_file"],
+                config["excel_sheet"],
+                config["filter2_column"],
+            )
+            queued_for_excel = True
 
-            except Exception as e:
-                with self.lock:
-                    task_to_process.status = "failed"
-                    task_to_process.error_msg = str(e)
+        except FileNotFoundError as e:
+            # The file is only checked here, not when the task is queued
+            with self.lock:
+                self._set_status(task_to_process, "failed")
+                task_to_process.error_msg = (
+                    f"{str(e)} - it was moved or deleted before processing"
+                )
+                self.has_changes = True  # Set flag when status changes
+            # Notify outside the lock; the notifier may block on the UI thread
+            self._notify_status_change()
+            print(f"[DEBUG] Task failed, PDF missing: {str(e)}")
+        except Exception as e:
+            with self.lock:
+                self._set_status(task_to_process, "failed")
+                task_to_process.error_msg = str(e)
+                self.has_changes = True  # Set flag when status changes
+            self._notify_status_change()
+            print(f"[DEBUG] Task failed: {str(e)}")
+        finally:
+            # If task is still in processing state, mark it as failed
+            timed_out = False
+            with self.lock:
+                if (
+                    task_to_process
+                    and task_to_process.status == "processing"
+                    and not queued_for_excel
+                ):
+                    self._set_status(task_to_process, "failed")
+                    task_to_process.error_msg = (
+                        "Task timed out or failed unexpectedly"
+                    )
                     self.has_changes = True  # Set flag when status changes
-                    self._notify_status_change()
-                print(f"[DEBUG] Task failed: {str(e)}")
-            finally:
-                # If task is still in processing state, mark it as failed
-                with self.lock:
-                    if task_to_process and task_to_process.status == "processing":
-                        task_to_process.status = "failed"
-                        task_to_process.error_msg = (
-                            "Task timed out or failed unexpectedly"
-                        )
-                        self.has_changes = True  # Set flag when status changes
-                        self._notify_status_change()
-                        print(
-                            "[DEBUG] Task marked as failed due to timeout or unexpected state"
-                        )
+                    timed_out = True
+            if timed_out:
+                self._notify_status_change()
+                print(
+                    "[DEBUG] Task marked as failed due to timeout or unexpected state"
+                )
 
     def add_skipped_task(self, task: PDFTask) -> None:
         """Add a skipped task to the queue without triggering processing."""
+        if not task.task_id:
+            task.task_id = self._next_task_id()
         with self.lock:
             task.end_time = datetime.now()  # Set end time immediately for skipped tasks
-            self.tasks[task.pdf_path] = task
+            self._store_task(task)
+            self._changes[task.pdf_path] = task
         self.mark_changed()
 
 
@@ -415,6 +874,7 @@ class ProcessingTab(Frame):
     """A modernized tab for processing PDF files with Excel data integration."""
 
     _instance = None  # Class-level instance tracking
+    _SHORTCUT_SEQUENCES = ("<Control-n>", "<Control-N>")  # Handled by _on_shortcut
 
     @classmethod
     def get_instance(cls) -> Optional['ProcessingTab']:
@@ -431,7 +891,28 @@ class ProcessingTab(Frame):
         status_handler: Callable[[str], None],
     ) -> None:
         self._pending_config_change_id = None  # Track pending config change operations
-        self._is_reloading = False  # Track Excel data reload state
+        self._config_cache: Optional[Dict[str, str]] = None  # Cleared on config change
+        self._confirm_enabled: Optional[bool] = None  # Last confirm button state
+        # Excel reloads run on one background worker; _excel_reload_key is the
+        # (file, sheet, filter2 column) being loaded and a newer request waits
+        self._excel_loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="excel-load"
+        )
+        self._excel_load_future: Optional[Future] = None
+        self._excel_reload_key: Optional[tuple[str, str, Optional[str]]] = None
+        self._excel_reload_again = False
+        # Bumped whenever the filters are refilled for a new PDF, so a reload
+        # finishing afterwards leaves the user's selections alone
+        self._filter_generation = 0
+        self._excel_reload_generation = 0
+        # Snapshot of the UI's ExcelManager the running reload started from
+        self._excel_reload_base: Optional[Dict[str, Any]] = None
+        self._last_size = (0, 0)  # Last window size seen by _on_window_resize
+        # (DataFrame, column, value -> row positions) for filter1 lookups
+        self._filter_groups_cache: tuple = (None, {})
+        # Filter index -> after_idle id of its pending selection update
+        self._filter_select_ids: Dict[int, str] = {}
+        self._label_texts: Dict[Label, str] = {}  # Text last set by _set_label_text
         ProcessingTab._instance = self  # Store instance
         super().__init__(master)
         self.master = master
@@ -451,16 +932,45 @@ class ProcessingTab(Frame):
 
         # Setup main layout
         self._setup_ui()
+        self._bind_keyboard_shortcuts()
         self.update_queue_display()
-        self.after(100, self._periodic_update)
+
+        # Refresh the queue display when the queue signals a change
+        self._active_tick_id: Optional[str] = None
+        self._queue_refresh_id: Optional[str] = None
+        self._queue_refresh_delay = 100  # ms; bursts of task transitions share one redraw
+        self.bind("<<QueueChanged>>", self._on_queue_changed)
+        self.bind("<<ExcelLoaded>>", self._apply_excel_reload)
+        self.pdf_queue.set_change_notifier(self._post_queue_changed)
 
         # Register for config changes
         self.config_manager.add_change_callback(self.on_config_change)
 
+    def _get_config(self) -> Dict[str, str]:
+        """Get the cached config, re-reading it after a config change.
+
+        Returns:
+            Dict[str, str]: The current configuration
+        """
+        if self._config_cache is None:
+            self._config_cache = self.config_manager.get_config()
+        return self._config_cache
+
+    def get_config_snapshot(self) -> Mapping[str, str]:
+        """Get a read-only view of the current configuration.
+
+        For other widgets that need config values; the underlying dict is
+        the tab's shared cache, so it must not be changed by callers.
+
+        Returns:
+            Mapping[str, str]: The current configuration
+        """
+        return MappingProxyType(self._get_config())
+
     def load_initial_data(self) -> None:
         """Load initial data asynchronously after window is shown."""
         try:
-            config = self.config_manager.get_config()
+            config = self._get_config()
             if config["source_folder"]:
                 self.load_next_pdf()
 
@@ -470,13 +980,14 @@ class ProcessingTab(Frame):
 
     def on_config_change(self) -> None:
         """Handle configuration changes and preset loading."""
+        self._config_cache = None
         # Cancel any pending operation
         if self._pending_config_change_id:
             print("[DEBUG] Canceling pending config change operation")
             self.after_cancel(self._pending_config_change_id)
 
         # Get the current config
-        config = self.config_manager.get_config()
+        config = self._get_config()
         
         # Only proceed if we have valid config values
         if not all([config[key] for key in ["excel_file", "excel_sheet"]]):
@@ -516,7 +1027,7 @@ class ProcessingTab(Frame):
                 self._finish_config_change()
             except Exception as e:
                 print(f"[DEBUG] Error in delayed config change: {str(e)}")
-                print(traceback.format_exc())
+                traceback.print_exc()
 
         # Schedule the delayed change
         self._pending_config_change_id = self.after(250, delayed_config_change)
@@ -530,7 +1041,7 @@ class ProcessingTab(Frame):
         
     def _check_source_folder_change(self) -> None:
         """Check if source folder changed and refresh PDF viewer if needed."""
-        config = self.config_manager.get_config()
+        config = self._get_config()
         current_source = getattr(self, '_current_source_folder', None)
         new_source = config["source_folder"]
         
@@ -542,12 +1053,28 @@ class ProcessingTab(Frame):
             self.current_pdf = None
             
             # Clear the PDF viewer
-            if hasattr(self.pdf_viewer, "canvas"):
-                self.pdf_viewer.canvas.delete("all")
+            self.pdf_viewer.clear()
                 
             # Load the next PDF from the new source folder
             self.load_next_pdf()
 
+    def _bind_keyboard_shortcuts(self) -> None:
+        """Bind application-wide shortcuts for this tab.
+
+        Each key sequence is bound once with bind_all to the same dispatcher
+        rather than on every descendant widget.
+        """
+        for sequence in self._SHORTCUT_SEQUENCES:
+            self.bind_all(sequence, self._on_shortcut)
+
+    def _on_shortcut(self, event: TkEvent) -> Optional[str]:
+        """Run the action for a shortcut; only fires while this tab is shown."""
+        if not self.winfo_ismapped():
+            return None
+        if event.keysym in ("n", "N"):
+            self.load_next_pdf(move_to_skipped=True)
+        return "break"
+
     def _setup_styles(self) -> None:
         """Configure custom styles for the interface."""
         style = Style()
@@ -677,12 +1204,11 @@ class ProcessingTab(Frame):
             200, min(800, self.start_width + delta_x)
         )  # Limit width between 200 and 400
 
-        # Only update if width actually changed
+        # Only update if width actually changed; Tk relayouts at idle, so no
+        # forced update_idletasks() per motion event
         if new_width != self.left_panel_width:
             self.left_panel_width = new_width
             self.left_panel.configure(width=new_width)
-            # Update layout
-            self.update_idletasks()
 
     def _end_resize(self, event: TkEvent) -> None:
         """End the resize operation."""
@@ -714,6 +1240,12 @@ class ProcessingTab(Frame):
     def _on_window_resize(self, event: TkEvent) -> None:
         """Handle window resize events."""
         if event.widget == self:
+            # Skip Configure events that did not change the size
+            size = (event.width, event.height)
+            if size == self._last_size:
+                return
+            self._last_size = size
+
             # Ensure minimum width for panels
             min_width = 800 if self.left_panel_visible else 600
             current_width = self.winfo_width()
@@ -862,7 +1394,7 @@ class ProcessingTab(Frame):
         self.filters_container.pack(fill="x", expand=True)
 
         # Load filters from config
-        config = self.config_manager.get_config()
+        config = self._get_config()
         filter_columns = []
         i = 1
         while True:
@@ -916,7 +1448,7 @@ class ProcessingTab(Frame):
         # Initialize with available values if this is the first filter
         if current_index == 0:  # Use current_index instead of len(self.filter_frames)
             try:
-                config = self.config_manager.get_config()
+                config = self._get_config()
                 if config["excel_file"] and config["excel_sheet"]:
                     if self.excel_manager.excel_data is None:
                         self.excel_manager.load_excel_data(
@@ -924,16 +1456,13 @@ class ProcessingTab(Frame):
                         )
 
                     if column_name:
-                        df = self.excel_manager.excel_data
-                        values = sorted(df[column_name].astype(str).unique().tolist())
-                        values = [str(x).strip() for x in values]
-                        fuzzy_frame.set_values(values)
+                        fuzzy_frame.set_values(self._get_filter1_values(column_name))
             except Exception as e:
                 print(f"[DEBUG] Error initializing first filter values: {str(e)}")
 
         # Bind events
         fuzzy_frame.bind(
-            "<<ValueSelected>>", lambda e: self._on_filter_select(current_index)
+            "<<ValueSelected>>", lambda e: self._queue_filter_select(current_index)
         )  # Use current_index
         fuzzy_frame.entry.bind("<KeyRelease>", lambda e: self.update_confirm_button())
 
@@ -947,13 +1476,32 @@ class ProcessingTab(Frame):
 
         return "break"
 
+    def _queue_filter_select(self, filter_index: int) -> None:
+        """Update the filters once the current burst of selection events is done.
+
+        A click selects a value more than once (<<ListboxSelect>> and the
+        double-click), so repeated events for a filter collapse into a single
+        _on_filter_select run when Tk goes idle.
+        """
+        pending = self._filter_select_ids.get(filter_index)
+        if pending is not None:
+            self.after_cancel(pending)
+        self._filter_select_ids[filter_index] = self.after_idle(
+            self._run_filter_select, filter_index
+        )
+
+    def _run_filter_select(self, filter_index: int) -> None:
+        """Run a queued filter selection update."""
+        self._filter_select_ids.pop(filter_index, None)
+        self._on_filter_select(filter_index)
+
     def _on_filter_select(self, filter_index: int) -> None:
         """Handle filter selection."""
-        try:
-            config = self.config_manager.get_config()
-            if self.excel_manager.excel_data is None:
-                return
+        if self.excel_manager.excel_data is None:
+            return
+        config = self._get_config()
 
+        try:
             # Get selected values up to current filter using FuzzySearchFrame's get method
             selected_values = []
             selected_row_idx = -1  # Store the row index from filter2 if available
@@ -973,19 +1521,24 @@ class ProcessingTab(Frame):
                             selected_row_idx = parsed_row_idx
                 selected_values.append(value)  # Keep the formatted value
 
-            # Start with the full DataFrame
-            df = self.excel_manager.excel_data.copy()
+            # Start with the full DataFrame (only read, so no copy is needed)
+            df = self.excel_manager.excel_data
 
             # If we're past filter2 and have a valid row index, filter based on that row
             if filter_index >= 1 and selected_row_idx >= 0:
                 df = df.iloc[[selected_row_idx]]
+            elif len(selected_values) > 1:
+                # Narrow to the filter1/filter2 group with a cached lookup
+                positions = self._get_filter_groups(
+                    config["filter1_column"], config["filter2_column"]
+                ).get(tuple(selected_values[:2]), [])
+                df = df.iloc[positions]
             else:
-                # Apply filters sequentially based on selected values up to filter2
-                for i, value in enumerate(
-                    selected_values[: min(2, len(selected_values))]
-                ):
-                    column = config[f"filter{i + 1}_column"]
-                    df = df[df[column].astype(str).str.strip() == value]
+                # Narrow to the filter1 group with a cached lookup instead of a column scan
+                positions = self._get_filter_groups(config["filter1_column"]).get(
+                    selected_values[0], []
+                )
+                df = df.iloc[positions]
 
             # Update next filter's values if there is one
             if filter_index < len(self.filter_frames) - 1:
@@ -994,14 +1547,15 @@ class ProcessingTab(Frame):
 
                 # Special handling for filter2 (index 1) to include row information
                 if filter_index == 0:  # This means we're updating filter2
-                    filter_values = []
-                    for idx, row in df.iterrows():
-                        value = str(row[next_column]).strip()
-                        has_hyperlink = self.excel_manager.has_hyperlink(idx)
-                        formatted_value = self._format_filter2_value(
-                            value, idx, has_hyperlink
-                        )
-                        filter_values.append(formatted_value)
+                    # Read the group's cells from the cached stripped column
+                    # rather than building a Series per row with iterrows()
+                    has_hyperlink = self.excel_manager.has_hyperlink
+                    filter_values = [
+                        self._format_filter2_value(value, idx, has_hyperlink(idx))
+                        for idx, value in self._get_stripped_column(next_column)
+                        .loc[df.index]
+                        .items()
+                    ]
                 else:
                     # For filters after filter2, if we have a row index, only show that row's value
                     if selected_row_idx >= 0:
@@ -1012,12 +1566,7 @@ class ProcessingTab(Frame):
                                 value = value.strftime("%d/%m/%Y")
                             elif pd.notnull(value):
                                 # Try parsing as date if it's not already a datetime
-                                for date_format in [
-                                    "%d/%m/%Y",
-                                    "%d-%m-%Y",
-                                    "%Y-%m-%d",
-                                    "%Y/%m/%d",
-                                ]:
+                                for date_format in DATE_FORMATS:
                                     try:
                                         parsed_date = datetime.strptime(
                                             str(value).strip(), date_format
@@ -1030,34 +1579,12 @@ class ProcessingTab(Frame):
                             [str(value).strip()] if pd.notnull(value) else []
                         )
                     else:
-                        # Handle date formatting for multiple values
-                        values = df[next_column].unique()
-                        filter_values = []
-                        for value in values:
-                            if "DATE" in next_column.upper():
-                                if pd.notnull(value) and isinstance(value, datetime):
-                                    formatted_value = value.strftime("%d/%m/%Y")
-                                elif pd.notnull(value):
-                                    # Try parsing as date if it's not already a datetime
-                                    try:
-                                        parsed_date = datetime.strptime(
-                                            str(value).strip(), "%d/%m/%Y"
-                                        )
-                                        formatted_value = parsed_date.strftime(
-                                            "%d/%m/%Y"
-                                        )
-                                    except ValueError:
-                                        formatted_value = str(value).strip()
-                                else:
-                                    continue
-                            else:
-                                formatted_value = str(value).strip()
-                            filter_values.append(formatted_value)
-                        filter_values = sorted(filter_values)
-
-                # Use FuzzySearchFrame's methods to update values
-                next_filter["fuzzy_frame"].clear()
-                next_filter["fuzzy_frame"].set_values(filter_values)
+                        filter_values = self._get_group_values(
+                            df, next_column, tuple(selected_values)
+                        )
+
+                # Clear the next filter and load its values in one pass
+                next_filter["fuzzy_frame"].reset(filter_values)
 
                 # Clear all subsequent filters using FuzzySearchFrame's methods
                 for i in range(filter_index + 2, len(self.filter_frames)):
@@ -1101,14 +1628,102 @@ class ProcessingTab(Frame):
 
         except Exception as e:
             print(f"[DEBUG] Error in _on_filter_select: {str(e)}")
-            print(traceback.format_exc())
+            traceback.print_exc()
             ErrorDialog(self, "Error", f"Error updating filters: {str(e)}")
 
+    def _get_filter_groups(self, *columns: str) -> Dict[Any, List[int]]:
+        """Map stripped filter values to their row positions in the Excel data.
+
+        Keys are plain values for one column and tuples for several. Each
+        index is built once per loaded DataFrame and set of columns, then
+        reused by every filter selection until the data is reloaded.
+        """
+        df = self.excel_manager.excel_data
+        indexes = self._get_filter_cache()
+        groups = indexes.get(columns)
+        if groups is None:
+            keys = [self._get_stripped_column(column) for column in columns]
+            grouper = keys[0] if len(keys) == 1 else keys
+            groups = {
+                value: positions.tolist()
+                for value, positions in df.groupby(grouper, sort=False).indices.items()
+            }
+            indexes[columns] = groups
+        return groups
+
+    def _get_stripped_column(self, column: str) -> pd.Series:
+        """Get a column as stripped strings, converted once per loaded DataFrame."""
+        cache = self._get_filter_cache()
+        key = ("stripped", column)
+        stripped = cache.get(key)
+        if stripped is None:
+            stripped = cache[key] = (
+                self.excel_manager.excel_data[column].astype(str).str.strip()
+            )
+        return stripped
+
+    def _get_group_values(
+        self, df: pd.DataFrame, column: str, group_key: tuple
+    ) -> Tuple[str, ...]:
+        """Get the sorted, display-formatted values of a column for a filter group.
+
+        Args:
+            df: The rows of the filter group
+            column: The column whose values are listed
+            group_key: The selected filter values identifying the group
+
+        Returns:
+            Tuple[str, ...]: Sorted values, cached until the Excel data is reloaded
+        """
+        cache = self._get_filter_cache()
+        key = ("values", column, group_key)
+        filter_values = cache.get(key)
+        if filter_values is not None:
+            return filter_values
+
+        filter_values = cache[key] = _format_filter_values(
+            df[column], "DATE" in column.upper()
+        )
+        return filter_values
+
+    def _get_filter1_values(self, column: str) -> Tuple[str, ...]:
+        """Get the sorted, stripped values of the first filter column.
+
+        Args:
+            column: The filter1 column name
+
+        Returns:
+            Tuple[str, ...]: Sorted values, cached until the Excel data is reloaded
+        """
+        cache = self._get_filter_cache()
+        key = ("filter1_values", column)
+        values = cache.get(key)
+        if values is None:
+            # Only the distinct cells are stringified, mapping NaN/None to ""
+            uniques = pd.Series(self.excel_manager.excel_data[column].unique())
+            strs = uniques.astype(str).str.strip()
+            strs[uniques.isna()] = ""
+            values = cache[key] = tuple(sorted(set(strs.tolist())))
+        return values
+
+    def _get_filter_cache(self) -> Dict[Any, Any]:
+        """Get the filter lookup cache, resetting it when the Excel data changed."""
+        df = self.excel_manager.excel_data
+        cache_df, cache = self._filter_groups_cache
+        if cache_df is not df:
+            cache = {}
+            self._filter_groups_cache = (df, cache)
+        return cache
+
     def update_confirm_button(self) -> None:
         """Update the confirm button state based on filter selections."""
         all_filters_selected = all(
             frame["fuzzy_frame"].get() for frame in self.filter_frames
         )
+        # Only touch the button and status when the state actually flips
+        if all_filters_selected == self._confirm_enabled:
+            return
+        self._confirm_enabled = all_filters_selected
 
         if all_filters_selected:
             self.confirm_button.state(["!disabled"])
@@ -1117,21 +1732,23 @@ class ProcessingTab(Frame):
             self.confirm_button.state(["disabled"])
             self._update_status("Select all filters")
 
+    def _set_label_text(self, label: Label, text: str) -> None:
+        """Configure a label's text only when it differs from what is shown."""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.config(text=text)
+
     def rotate_clockwise(self) -> None:
         """Rotate the PDF view clockwise."""
         self.pdf_manager.rotate_page(clockwise=True)
-        self.rotation_label.config(text=f"{self.pdf_manager.get_rotation()}°")
-        self.pdf_viewer.display_pdf(
-            self.current_pdf, self.pdf_viewer.zoom_level, show_loading=False
-        )
+        self._set_label_text(self.rotation_label, f"{self.pdf_manager.get_rotation()}°")
+        self.pdf_viewer.show_rotation()
 
     def rotate_counterclockwise(self) -> None:
         """Rotate the PDF view counterclockwise."""
         self.pdf_manager.rotate_page(clockwise=False)
-        self.rotation_label.config(text=f"{self.pdf_manager.get_rotation()}°")
-        self.pdf_viewer.display_pdf(
-            self.current_pdf, self.pdf_viewer.zoom_level, show_loading=False
-        )
+        self._set_label_text(self.rotation_label, f"{self.pdf_manager.get_rotation()}°")
+        self.pdf_viewer.show_rotation()
 
     def _move_to_skipped_folder(self, pdf_path: str) -> None:
         """Move a skipped PDF file to the skipped documents folder."""
@@ -1155,15 +1772,10 @@ class ProcessingTab(Frame):
                     counter += 1
 
             # Clear all PDF handles
-            # 1. Clear the PDF viewer canvas
-            if hasattr(self.pdf_viewer, "canvas"):
-                self.pdf_viewer.canvas.delete("all")
+            # 1. Clear the PDF viewer and stop any render still using the file
+            self.pdf_viewer.clear()
 
-            # 2. Clear the PDF viewer's cached image
-            if hasattr(self.pdf_viewer, "current_image"):
-                self.pdf_viewer.current_image = None
-
-            # 3. Close any open PDF files in the PDF manager
+            # 2. Close any open PDF files in the PDF manager
             self.pdf_manager.clear_cache()  # Clear the cached PDF document
             self.pdf_manager.close_current_pdf()  # Close any other open PDFs
 
@@ -1192,7 +1804,7 @@ class ProcessingTab(Frame):
             move_to_skipped: If True, moves current file to skipped folder before loading next.
         """
         try:
-            config = self.config_manager.get_config()
+            config = self._get_config()
             current_file = self.current_pdf
 
             # Clear current PDF reference before moving to prevent double-skipping
@@ -1202,7 +1814,7 @@ class ProcessingTab(Frame):
             if move_to_skipped and current_file and path.exists(current_file):
                 # Create a skipped task with the existing start time
                 task = PDFTask(
-                    task_id=PDFTask.generate_id(),
+                    task_id="",  # Assigned by the queue
                     pdf_path=current_file,
                     filter_values=[""]
                     * len(self.filter_frames),  # Empty values for all filters
@@ -1256,29 +1868,22 @@ class ProcessingTab(Frame):
                 self._current_source_folder = config["source_folder"]
                 self.file_info["text"] = path.basename(next_pdf)
                 self.pdf_viewer.display_pdf(next_pdf, 1)
-                self.rotation_label.config(text="0°")
-                self.zoom_label.config(text="100%")
+                self._set_label_text(self.rotation_label, "0°")
+                self._set_label_text(self.zoom_label, "100%")
 
-                # Clear all filters
-                for frame in self.filter_frames:
-                    frame["fuzzy_frame"].clear()
-
-                # Reset first filter values if available
-                if len(self.filter_frames) > 0:
-                    config = self.config_manager.get_config()
-                    if (
-                        config["excel_file"]
-                        and config["excel_sheet"]
-                        and self.excel_manager.excel_data is not None
-                    ):
-                        first_column = config.get("filter1_column")
-                        if first_column:
-                            df = self.excel_manager.excel_data
-                            values = sorted(
-                                df[first_column].astype(str).unique().tolist()
-                            )
-                            values = [str(x).strip() for x in values]
-                            self.filter_frames[0]["fuzzy_frame"].set_values(values)
+                # Reset all filters in one pass each, restoring the first filter's values
+                filter1_values = ()
+                first_column = config.get("filter1_column")
+                if (
+                    first_column
+                    and config["excel_file"]
+                    and config["excel_sheet"]
+                    and self.excel_manager.excel_data is not None
+                ):
+                    filter1_values = self._get_filter1_values(first_column)
+                for i, frame in enumerate(self.filter_frames):
+                    frame["fuzzy_frame"].reset(filter1_values if i == 0 else ())
+                self._filter_generation += 1
 
                 # Focus the first filter
                 if self.filter_frames:
@@ -1289,20 +1894,19 @@ class ProcessingTab(Frame):
                 self.file_info["text"] = "No PDF files found"
                 self._update_status("No files to process")
                 # Clear the PDF viewer
-                if hasattr(self.pdf_viewer, "canvas"):
-                    self.pdf_viewer.canvas.delete("all")
+                self.pdf_viewer.clear()
                 # Disable the confirm button since there's no file to process
                 self.confirm_button.state(["disabled"])
 
         except Exception as e:
             print("[DEBUG] Error in load_next_pdf:")
-            print(traceback.format_exc())
+            traceback.print_exc()
             ErrorDialog(self, "Error", f"Error loading next PDF: {str(e)}")
 
     def _on_file_info_click(self, event: TkEvent) -> None:
         """Handle click on file info label to open file picker."""
         try:
-            config = self.config_manager.get_config()
+            config = self._get_config()
 
             # Reload Excel data to ensure we have fresh data
             if config["excel_file"] and config["excel_sheet"]:
@@ -1341,29 +1945,22 @@ class ProcessingTab(Frame):
                 # Update UI elements
                 self.file_info["text"] = path.basename(file_path)
                 self.pdf_viewer.display_pdf(file_path, 1)
-                self.rotation_label.config(text="0°")
-                self.zoom_label.config(text="100%")
+                self._set_label_text(self.rotation_label, "0°")
+                self._set_label_text(self.zoom_label, "100%")
 
-                # Clear all filters
-                for frame in self.filter_frames:
-                    frame["fuzzy_frame"].clear()
-
-                # Reset first filter values if available
-                if len(self.filter_frames) > 0:
-                    config = self.config_manager.get_config()
-                    if (
-                        config["excel_file"]
-                        and config["excel_sheet"]
-                        and self.excel_manager.excel_data is not None
-                    ):
-                        first_column = config.get("filter1_column")
-                        if first_column:
-                            df = self.excel_manager.excel_data
-                            values = sorted(
-                                df[first_column].astype(str).unique().tolist()
-                            )
-                            values = [str(x).strip() for x in values]
-                            self.filter_frames[0]["fuzzy_frame"].set_values(values)
+                # Reset all filters in one pass each, restoring the first filter's values
+                filter1_values = ()
+                first_column = config.get("filter1_column")
+                if (
+                    first_column
+                    and config["excel_file"]
+                    and config["excel_sheet"]
+                    and self.excel_manager.excel_data is not None
+                ):
+                    filter1_values = self._get_filter1_values(first_column)
+                for i, frame in enumerate(self.filter_frames):
+                    frame["fuzzy_frame"].reset(filter1_values if i == 0 else ())
+                self._filter_generation += 1
 
                 # Focus the first filter
                 if self.filter_frames:
@@ -1376,12 +1973,11 @@ class ProcessingTab(Frame):
 
         except Exception as e:
             print("[DEBUG] Error in _on_file_info_click:")
-            print(traceback.format_exc())
+            traceback.print_exc()
             ErrorDialog(self, "Error", f"Error loading PDF: {str(e)}")
 
             # Clear PDF viewer on error
-            if hasattr(self.pdf_viewer, "canvas"):
-                self.pdf_viewer.canvas.delete("all")
+            self.pdf_viewer.clear()
             # Disable the confirm button since there's no file to process
             self.confirm_button.state(["disabled"])
 
@@ -1474,7 +2070,7 @@ class ProcessingTab(Frame):
                 filter_values.append(value)
 
             # Get the config to access filter columns
-            config = self.config_manager.get_config()
+            config = self._get_config()
 
             # Get all filter column names from config
             filter_columns = []
@@ -1520,12 +2116,13 @@ class ProcessingTab(Frame):
                         self._update_status(f"Failed to add new row: {str(e)}")
                         return
 
-            # Create PDFTask with a unique task ID, preserving the formatted filter2 value
+            # Create PDFTask (the queue assigns its ID), preserving the formatted filter2 value
             task = PDFTask(
-                task_id=PDFTask.generate_id(),
+                task_id="",
                 pdf_path=self.current_pdf,
                 filter_values=filter_values,  # Keep the formatted value to avoid re-parsing
                 row_idx=row_idx,
+                rotation=self.pdf_manager.get_rotation(),
             )
 
             # Add task to queue
@@ -1536,7 +2133,7 @@ class ProcessingTab(Frame):
 
         except Exception as e:
             print(f"[DEBUG] Error in process_current_file: {str(e)}")
-            print(traceback.format_exc())
+            traceback.print_exc()
             ErrorDialog(self, "Error", f"Error processing file: {str(e)}")
             self._update_status("Error processing file")
 
@@ -1546,17 +2143,24 @@ class ProcessingTab(Frame):
         if not selection:
             return
 
-        item = selection[0]
-        task_path = self.queue_display.table.item(item)["values"][0]
+        task_path = self.queue_display.get_task_path(selection[0])
+        if task_path is None:
+            return
 
         with self.pdf_queue.lock:
             task = self.pdf_queue.tasks.get(task_path)
-            if task and task.status == "failed" and task.error_msg:
-                ErrorDialog(
-                    self,
-                    "Processing Error",
-                    f"Error processing {path.basename(task_path)}:\n{task.error_msg}",
-                )
+            error_msg = (
+                task.error_msg
+                if task and task.status in ("failed", "link_failed")
+                else ""
+            )
+        # The dialog is modal, so it is shown after releasing the queue lock
+        if error_msg:
+            ErrorDialog(
+                self,
+                "Processing Error",
+                f"Error processing {path.basename(task_path)}:\n{error_msg}",
+            )
 
     def _clear_completed(self) -> None:
         """Clear completed tasks from the queue."""
@@ -1570,57 +2174,86 @@ class ProcessingTab(Frame):
 
     def update_queue_display(self) -> None:
         """Update the queue display with current tasks."""
-        try:
-            with self.pdf_queue.lock:
-                tasks = self.pdf_queue.tasks.copy()
-                # Update queue statistics
-                total = len(tasks)
-                completed = sum(1 for t in tasks.values() if t.status == "completed")
-                failed = sum(1 for t in tasks.values() if t.status == "failed")
-                skipped = sum(1 for t in tasks.values() if t.status == "skipped")
-                pending = sum(
-                    1 for t in tasks.values() if t.status in ["pending", "processing"]
-                )
-
-            # Update the display
-            self.queue_display.update_display(tasks)
-
-            # Update statistics display
-            if total > 0:
-                self.queue_stats.configure(
-                    text=f"Queue: {total} total ({completed} completed, {
-                        failed
-                    } failed, {skipped} skipped, {pending} pending)"
-                )
-            else:
-                self.queue_stats.configure(text="Queue: 0 total")
+        # Queue statistics come straight from the status buckets' sizes
+        total, counts = self.pdf_queue.get_status_counts()
+        completed = counts.get("completed", 0)
+        failed = counts.get("failed", 0)
+        skipped = counts.get("skipped", 0)
+        failed += counts.get("link_failed", 0)
+        pending = counts.get("pending", 0) + counts.get("processing", 0)
+        changes = self.pdf_queue.drain_changes()
+
+        # Hyperlinks written by the workers, mirrored into the UI's manager here
+        # so it is only ever touched from the UI thread
+        for excel_file, sheet_name, row_idx in self.pdf_queue.drain_hyperlink_updates():
+            self.excel_manager.set_hyperlink_status(excel_file, sheet_name, row_idx)
+
+        if total > 0:
+            stats_text = f"Queue: {total} total ({completed} completed, {
+                failed
+            } failed, {skipped} skipped, {pending} pending)"
+        else:
+            stats_text = "Queue: 0 total"
 
-        except Exception as e:
+        try:
+            # Update the display with only the rows that changed
+            self.queue_display.update_display(changes)
+            self.queue_stats.configure(text=stats_text)
+        except TclError as e:
+            # Widgets already destroyed (e.g. during shutdown)
             print(f"[DEBUG] Error updating queue display: {str(e)}")
-            import traceback
 
-            print(traceback.format_exc())
+    def _post_queue_changed(self) -> None:
+        """Post a <<QueueChanged>> event; safe to call from worker threads."""
+        try:
+            self.event_generate("<<QueueChanged>>", when="tail")
+        except (RuntimeError, TclError) as e:
+            # Main loop not running (e.g. during shutdown)
+            print(f"[DEBUG] Could not post queue change: {str(e)}")
+
+    def _on_queue_changed(self, event: Optional[TkEvent] = None) -> None:
+        """Schedule a queue refresh, coalescing changes that arrive within 100 ms."""
+        if self._queue_refresh_id is None:
+            self._queue_refresh_id = self.after(
+                self._queue_refresh_delay, self._refresh_queue
+            )
 
-    def _periodic_update(self) -> None:
-        """Periodically check for changes and update the queue display only if needed."""
+    def _refresh_queue(self) -> None:
+        """Update the queue display after the queue signalled a change."""
+        self._queue_refresh_id = None
         try:
             if (
                 self.pdf_queue.check_and_clear_changes()
             ):  # Only update if there were changes
+                self.pdf_queue.run_status_callbacks()
                 self.update_queue_display()
         except Exception as e:
-            print(f"[DEBUG] Error in periodic update: {str(e)}")
+            print(f"[DEBUG] Error handling queue change: {str(e)}")
+        finally:
+            self._schedule_active_tick()
+
+    def _schedule_active_tick(self) -> None:
+        """Keep elapsed times ticking once a second while tasks are active."""
+        if self._active_tick_id is None and self.pdf_queue.has_active_tasks():
+            self._active_tick_id = self.after(1000, self._active_tick)
+
+    def _active_tick(self) -> None:
+        """Refresh elapsed times of active tasks, stopping once none remain."""
+        self._active_tick_id = None
+        try:
+            self.update_queue_display()
         finally:
-            self.after(500, self._periodic_update)
+            self._schedule_active_tick()
 
-    def __del__(self) -> None:
-        """Clean up resources when the tab is destroyed."""
+    def destroy(self) -> None:
+        """Stop the processing queue, then destroy the tab's widgets."""
         try:
-            if hasattr(self, "pdf_queue"):
-                self.pdf_queue.stop()
-        except (RuntimeError, AttributeError) as e:
-            # Log but don't raise errors during cleanup since object is being destroyed
+            self.pdf_queue.stop()
+            self._excel_loader.shutdown(wait=False, cancel_futures=True)
+        except RuntimeError as e:
+            # Log but don't raise errors during cleanup since the tab is going away
             print(f"[DEBUG] Error during ProcessingTab cleanup: {str(e)}")
+        super().destroy()
 
     def handle_config_change(self) -> None:
         """Handle configuration changes by reloading the current PDF if one is loaded."""
@@ -1633,77 +2266,133 @@ class ProcessingTab(Frame):
             self.update_queue_display()
 
     def reload_excel_data_and_update_ui(self, trigger_source: str = "unknown") -> None:
-        """Reload Excel data and update UI elements.
-        
+        """Reload Excel data in the background, then update the filters.
+
+        The workbook is read and its hyperlinks cached on a worker thread so
+        the UI keeps responding; the filters are refreshed once it is done.
+
         Args:
             trigger_source: Identifier for the code path triggering the reload
         """
-        # Prevent recursive or concurrent reloads
-        if self._is_reloading:
+        config = self._get_config()
+        excel_file = config["excel_file"]
+        excel_sheet = config["excel_sheet"]
+        if not all([excel_file, excel_sheet]):
+            print("Missing configuration values")
+            return
+        filter2_column = (
+            config.get("filter2_column") if len(self.filter_frames) > 1 else None
+        )
+        key = (excel_file, excel_sheet, filter2_column)
+
+        # Only one reload runs at a time; a request for other settings is
+        # picked up again when the running one finishes
+        if self._excel_load_future is not None:
+            if key != self._excel_reload_key:
+                self._excel_reload_again = True
             print(f"[DEBUG] Skipping reload from {trigger_source} - reload already in progress")
             return
-            
+
         print(f"[DEBUG] Entering reload_excel_data_and_update_ui - Triggered by: {trigger_source}")
-        self._is_reloading = True
+        self._excel_reload_key = key
+        self._excel_reload_generation = self._filter_generation
+        filter_columns = [
+            config.get(f"filter{i}_column")
+            for i in range(1, len(self.filter_frames) + 1)
+        ]
+        self._excel_reload_base = self._get_excel_state(self.excel_manager)
+        future = self._excel_loader.submit(
+            self._load_excel_data, key, self._excel_reload_base, filter_columns
+        )
+        self._excel_load_future = future
+        future.add_done_callback(self._post_excel_loaded)
+
+    @staticmethod
+    def _get_excel_state(excel_manager: ExcelManager) -> Dict[str, Any]:
+        """Snapshot an ExcelManager's loaded sheet and hyperlink cache.
+
+        The hyperlink cache is copied, as the UI thread keeps updating it.
+        """
+        state = {
+            name: getattr(excel_manager, name, None) for name in _EXCEL_STATE_ATTRS
+        }
+        state["_hyperlink_cache"] = dict(state["_hyperlink_cache"] or {})
+        return state
+
+    @staticmethod
+    def _set_excel_state(excel_manager: ExcelManager, state: Dict[str, Any]) -> None:
+        """Give an ExcelManager the loaded sheet and hyperlink cache in ``state``."""
+        for name, value in state.items():
+            if value is None and name == "_last_cached_key":
+                # ExcelManager tests for this attribute with hasattr
+                if hasattr(excel_manager, name):
+                    delattr(excel_manager, name)
+            else:
+                setattr(excel_manager, name, value)
+
+    def _load_excel_data(
+        self,
+        key: tuple[str, str, Optional[str]],
+        state: Dict[str, Any],
+        filter_columns: List[Optional[str]],
+    ) -> Optional[Dict[str, Any]]:
+        """Load the workbook and cache filter2 hyperlinks (worker thread).
+
+        The work is done on a separate ExcelManager seeded with ``state``, so
+        the UI's manager is only touched on the Tk thread.
+
+        Returns:
+            Optional[Dict[str, Any]]: The new sheet and hyperlink state, or
+            None if the UI's data is still current
+        """
+        excel_file, excel_sheet, filter2_column = key
+        loader = type(self.excel_manager)()
+        self._set_excel_state(loader, state)
+        print("[DEBUG] Cache state before Excel load - size:", len(loader._hyperlink_cache))
+        excel_loaded = loader.load_excel_data(excel_file, excel_sheet)
+        print(
+            f"[DEBUG] Excel data {'was reloaded' if excel_loaded else 'used cached version'}"
+        )
+        if excel_loaded:
+            self._categorize_filter_columns(loader.excel_data, filter_columns)
+
+        # Cache hyperlinks for filter2 column in all cases to ensure it's up to date
+        if filter2_column:
+            print("[DEBUG] Processing hyperlinks for filter2:")
+            print(f"[DEBUG] - Sheet: {excel_sheet}")
+            print(f"[DEBUG] - Column: {filter2_column}")
+            loader.cache_hyperlinks_for_column(excel_file, excel_sheet, filter2_column)
+            print(f"[DEBUG] - Cache size after: {len(loader._hyperlink_cache)}")
+
+        # A cache hit leaves the seeded cache dict in place
+        if not excel_loaded and loader._hyperlink_cache is state["_hyperlink_cache"]:
+            return None
+        return self._get_excel_state(loader)
+
+    def _post_excel_loaded(self, future: Future) -> None:
+        """Wake the Tk thread once an Excel reload finished (worker thread)."""
+        if future.cancelled():
+            return
         try:
-            config = self.config_manager.get_config()
-            if not all(
-                [
-                    config["excel_file"],
-                    config["excel_sheet"],
-                ]
-            ):
-                print("Missing configuration values")
-                return
+            self.event_generate("<<ExcelLoaded>>", when="tail")
+        except (RuntimeError, TclError) as e:
+            # Main loop not running (e.g. during shutdown)
+            print(f"[DEBUG] Could not post Excel reload: {str(e)}")
 
-            print(
-                "[DEBUG] Cache state before Excel load - size:",
-                len(self.excel_manager._hyperlink_cache),
-            )
-            # Load Excel data only if needed and store old filter2 value if it exists
-            old_filter2_value = None
-            if len(self.filter_frames) > 1:
-                old_filter2_value = self.filter_frames[1]["fuzzy_frame"].get()
-                if old_filter2_value:
-                    print(f"[DEBUG] Preserving filter2 value: {old_filter2_value}")
-
-            excel_loaded = self.excel_manager.load_excel_data(
-                config["excel_file"], config["excel_sheet"]
-            )
-            print(
-                f"[DEBUG] Excel data {'was reloaded' if excel_loaded else 'used cached version'}"
-            )
-            print(
-                "[DEBUG] Cache state after Excel load - size:",
-                len(self.excel_manager._hyperlink_cache),
-            )
+    def _apply_excel_reload(self, event: Optional[TkEvent] = None) -> None:
+        """Swap in the reloaded Excel data and refresh the filters.
 
-            # Restore filter2 value if it was previously set
-            if old_filter2_value:
-                print(f"[DEBUG] Restoring preserved filter2 value: {old_filter2_value}")
-                if len(self.filter_frames) > 1:
-                    self.filter_frames[1]["fuzzy_frame"].set_values([old_filter2_value])
-
-            # Cache hyperlinks for filter2 column in all cases to ensure it's up to date
-            if len(self.filter_frames) > 1:
-                filter2_column = config.get("filter2_column")
-                if filter2_column:
-                    print("[DEBUG] Processing hyperlinks for filter2:")
-                    print(f"[DEBUG] - Sheet: {config['excel_sheet']}")
-                    print(f"[DEBUG] - Column: {filter2_column}")
-                    print(f"[DEBUG] - Cache size before: {len(self.excel_manager._hyperlink_cache)}")
-                    print(f"[DEBUG] - Cache key before: {getattr(self.excel_manager, '_last_cached_key', 'None')}")
-                    
-                    self.excel_manager.cache_hyperlinks_for_column(
-                        config["excel_file"], config["excel_sheet"], filter2_column
-                    )
-                    
-                    print(f"[DEBUG] - Cache size after: {len(self.excel_manager._hyperlink_cache)}")
-                    print(f"[DEBUG] - Cache key after: {getattr(self.excel_manager, '_last_cached_key', 'None')}")
-                    
-                    if len(self.filter_frames) > 1 and self.filter_frames[1]["fuzzy_frame"].get():
-                        current_value = self.filter_frames[1]["fuzzy_frame"].get()
-                        print(f"[DEBUG] Current filter2 value: {current_value}")
+        Filters are only refilled when the data changed. If they were refilled
+        for a new PDF while loading, the user's selections are kept and only
+        the first filter's value list is updated.
+        """
+        future = self._excel_load_future
+        if future is None or not future.done():
+            return
+        self._excel_load_future = None
+        try:
+            state = future.result()
+            config = self._get_config()
 
             # Update filter labels
             for i, frame in enumerate(self.filter_frames, 1):
@@ -1711,37 +2400,64 @@ class ProcessingTab(Frame):
                 if column_name:
                     frame["label"]["text"] = column_name
 
-            df = self.excel_manager.excel_data
-
-            # Convert all values to strings to ensure consistent type handling
-            def safe_convert_to_str(val):
-                if pd.isna(val):  # Handle NaN/None values
-                    return ""
-                return str(val).strip()
+            if state is None:
+                print("[DEBUG] Excel data unchanged, keeping the filters")
+                return
+            base = self._excel_reload_base
+            if self.excel_manager.excel_data is not base["excel_data"]:
+                # Data was loaded on the UI thread meanwhile; start over from it
+                self._excel_reload_again = True
+                return
+            if state["_last_cached_key"] == base["_last_cached_key"]:
+                # Keep rows the queue linked while the reload was running
+                links = state["_hyperlink_cache"]
+                for row_idx, linked in self.excel_manager._hyperlink_cache.items():
+                    if linked and not base["_hyperlink_cache"].get(row_idx):
+                        links[row_idx] = True
+            self._set_excel_state(self.excel_manager, state)
 
-            # Store all values for the first filter regardless of Excel reload status
             if len(self.filter_frames) > 0:
                 first_column = config.get("filter1_column")
                 if first_column:
-                    values = sorted(df[first_column].astype(str).unique().tolist())
-                    values = [safe_convert_to_str(x) for x in values]
+                    values = self._get_filter1_values(first_column)
                     self.filter_frames[0]["fuzzy_frame"].set_values(values)
 
-                # Clear other filters
-                for frame in self.filter_frames[1:]:
-                    frame["fuzzy_frame"].clear()
-                    frame["fuzzy_frame"].set_values([])
+                # Clear other filters unless they were refilled for a new PDF
+                if self._filter_generation == self._excel_reload_generation:
+                    for frame in self.filter_frames[1:]:
+                        frame["fuzzy_frame"].reset()
 
         except Exception as e:
             print("[DEBUG] Error in reload_excel_data_and_update_ui:")
-            print(traceback.format_exc())
+            traceback.print_exception(e)
             ErrorDialog(self, "Error", f"Error loading Excel data: {str(e)}")
         finally:
-            self._is_reloading = False
-            print("[DEBUG] Completed Excel data reload - cleared reloading flag")
+            print("[DEBUG] Completed Excel data reload")
+            if self._excel_reload_again:
+                self._excel_reload_again = False
+                self.reload_excel_data_and_update_ui(trigger_source="queued reload")
+
+    @staticmethod
+    def _categorize_filter_columns(
+        df: pd.DataFrame, filter_columns: List[Optional[str]]
+    ) -> None:
+        """Store the text filter columns of freshly loaded data as categoricals.
+
+        Filter columns repeat a small set of values, so categorical codes make
+        string conversion and comparisons run once per distinct value.
+
+        Args:
+            df: The freshly loaded sheet, not yet shared with the UI
+            filter_columns: The configured filter column names
+        """
+        for column in filter_columns:
+            if column in df.columns and df[column].dtype == object:
+                df[column] = df[column].astype("category")
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def _format_filter2_value(
-        self, value: str, row_idx: int, has_hyperlink: bool = False
+        value: str, row_idx: int, has_hyperlink: bool = False
     ) -> str:
         """Format filter2 value with row number and checkmark if hyperlinked."""
         prefix = "✓ " if has_hyperlink else ""
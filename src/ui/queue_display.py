@@ -14,14 +14,22 @@ from tkinter.ttk import (
     Treeview as ttkTreeview,
 )
 
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
+from itertools import count
 from os import path
 from ..utils import PDFTask
+import traceback
 
 class QueueDisplay(ttkFrame):
     def __init__(self, master: TkWidget):
         super().__init__(master)
+        # Task path -> (row iid, task, last values, last status, filter values
+        # the row was formatted from); rows get short numeric iids so long
+        # paths are not sent through Tcl on every update
+        self._row_index: Dict[str, tuple[str, PDFTask, tuple, str, tuple]] = {}
+        self._row_paths: Dict[str, str] = {}  # Row iid -> task path
+        self._iid_counter = count(1)
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -163,6 +171,7 @@ class QueueDisplay(ttkFrame):
         self.table.tag_configure("processing", foreground="#007bff")
         self.table.tag_configure("completed", foreground="#28a745")
         self.table.tag_configure("failed", foreground="#dc3545")
+        self.table.tag_configure("link_failed", foreground="#dc3545")
         self.table.tag_configure("reverted", foreground="#6c757d")
         self.table.tag_configure("skipped", foreground="#ffc107")  # Yellow color for skipped files
 
@@ -172,6 +181,7 @@ class QueueDisplay(ttkFrame):
             "processing": "↻",  # Rotating arrow
             "completed": "✓",  # Checkmark
             "failed": "✗",  # X mark
+            "link_failed": "⚠",  # Warning sign: moved, but the Excel link is missing
             "reverted": "↺",  # Curved arrow for reverted status
             "skipped": "⤳",  # Arrow pointing right for skipped files
         }
@@ -223,39 +233,90 @@ class QueueDisplay(ttkFrame):
         parts = values_str.split(" | ")
         return " → ".join(parts)  # Using arrow for better visual flow
 
-    def update_display(self, tasks: Dict[str, PDFTask]) -> None:
-        """Update the queue display with the current tasks."""
-        # Clear existing items
-        for item in self.table.get_children():
-            self.table.delete(item)
-
-        # Add tasks to the table
-        for task in tasks.values():
-            # Format values for display
-            values_display = self._format_values_display(" | ".join(task.filter_values))
-            
-            # Format time
-            time_display = ""
-            if task.end_time:
-                duration = task.end_time - task.start_time
-                time_display = f"{duration.seconds}s"
-            elif task.start_time:
-                duration = datetime.now() - task.start_time
-                time_display = f"{duration.seconds}s"
+    def update_display(self, changes: Dict[str, Optional[PDFTask]]) -> None:
+        """Apply task changes to the queue display.
+
+        Rows are keyed by task path. Changed tasks are inserted, updated or
+        deleted, and rows still pending or processing are re-rendered so their
+        time ticks and status transitions show up. Other rows are untouched.
+
+        Args:
+            changes: Changed task paths mapped to their task, or None if the
+                task left the queue
+        """
+        # Bound once here as these run for every changed or active row
+        row_index = self._row_index
+        render_row = self._render_row
+        delete_row = self.table.delete
+
+        for task_path, task in changes.items():
+            if task is None:
+                row = row_index.pop(task_path, None)
+                if row is not None:
+                    del self._row_paths[row[0]]
+                    delete_row(row[0])
+            else:
+                render_row(task_path, task)
+
+        for task_path, (_, task, _, status, _) in list(row_index.items()):
+            if status in ("pending", "processing") and task_path not in changes:
+                render_row(task_path, task)
+
+    def get_task_path(self, iid: str) -> Optional[str]:
+        """Get the path of the task shown in a row.
+
+        Args:
+            iid: The Treeview item id of the row
+
+        Returns:
+            Optional[str]: The task path, or None if the row is unknown
+        """
+        return self._row_paths.get(iid)
+
+    def _render_row(self, task_path: str, task: PDFTask) -> None:
+        """Insert or update the row for a task if its displayed values changed."""
+        # Format time
+        time_display = ""
+        if task.end_time:
+            duration = task.end_time - task.start_time
+            time_display = f"{duration.seconds}s"
+        elif task.start_time:
+            duration = datetime.now() - task.start_time
+            time_display = f"{duration.seconds}s"
+
+        # The file name is fixed per task; the filter values are only
+        # re-formatted when they changed (processing rewrites filter2)
+        cached = self._row_index.get(task_path)
+        filter_values = tuple(task.filter_values)
+        if cached is not None and cached[1] is task:
+            filename = cached[2][1]
+        else:
+            filename = path.basename(task.pdf_path)
+        if cached is not None and cached[1] is task and cached[4] == filter_values:
+            values_display = cached[2][2]
+        else:
+            values_display = self._format_values_display(" | ".join(filter_values))
+
+        status = task.status
+        values = (
+            task.task_id,
+            filename,
+            values_display,
+            f"{self.status_icons.get(status, '')} {status}",
+            time_display
+        )
 
+        if cached is None:
             # Insert task into table
-            self.table.insert(
-                "",
-                "end",
-                values=(
-                    task.task_id,
-                    path.basename(task.pdf_path),
-                    values_display,
-                    f"{self.status_icons.get(task.status, '')} {task.status}",
-                    time_display
-                ),
-                tags=(task.status,)
-            )
+            iid = str(next(self._iid_counter))
+            self.table.insert("", "end", iid=iid, values=values, tags=(status,))
+            self._row_paths[iid] = task_path
+        else:
+            iid, _, last_values, last_status, _ = cached
+            if last_values == values and last_status == status:
+                return
+            self.table.item(iid, values=values, tags=(status,))
+        self._row_index[task_path] = (iid, task, values, status, filter_values)
 
     def _get_processing_tab(self):
         """Get the parent ProcessingTab instance by looping through parent widgets."""
@@ -291,11 +352,12 @@ class QueueDisplay(ttkFrame):
 
         try:
             # Revert Excel hyperlink
+            config = processing_tab.get_config_snapshot()
             processing_tab.excel_manager.revert_pdf_link(
-                excel_file=processing_tab.config_manager.get_config()["excel_file"],
-                sheet_name=processing_tab.config_manager.get_config()["excel_sheet"],
+                excel_file=config["excel_file"],
+                sheet_name=config["excel_sheet"],
                 row_idx=task.row_idx,
-                filter2_col=processing_tab.config_manager.get_config()["filter2_column"],
+                filter2_col=config["filter2_column"],
                 original_hyperlink=task.original_excel_hyperlink,
                 original_value=task.value2,
             )
@@ -313,7 +375,6 @@ class QueueDisplay(ttkFrame):
 
         except Exception as e:
             print(f"[DEBUG] Revert failed: {str(e)}")
-            import traceback
             print(traceback.format_exc())
             TkMessagebox.showerror("Revert Failed", f"Failed to revert the task: {str(e)}")
 
@@ -1,6 +1,5 @@
 from os import path, remove
 from pandas import read_excel, ExcelFile, DataFrame, Series
-from pandas.api.types import is_datetime64_any_dtype
 from openpyxl import load_workbook
 from openpyxl.worksheet.hyperlink import Hyperlink
 from openpyxl.styles import Font
@@ -93,7 +92,6 @@ class ExcelManager:
     This class provides functionality to:
     - Load and cache Excel data
     - Update PDF hyperlinks in Excel files
-    - Find matching rows based on filter criteria
     - Handle network paths with timeouts and retries
     - Manage Excel sheets and columns
 
@@ -289,7 +287,6 @@ class ExcelManager:
                 print("[DEBUG] Restoring previous cache after error")
                 self._hyperlink_cache = {}
 
-    @retry_with_backoff
     def update_pdf_link(
         self,
         excel_file: str,
@@ -310,19 +307,44 @@ class ExcelManager:
         Returns:
             Optional[str]: The original hyperlink if it existed, else None
         """
+        return self.apply_pdf_link_batch(
+            excel_file, sheet_name, filter2_col, [(row_idx, pdf_path)]
+        )[0]
+
+    @retry_with_backoff
+    def apply_pdf_link_batch(
+        self,
+        excel_file: str,
+        sheet_name: str,
+        filter2_col: str,
+        links: List[Tuple[int, str]],
+    ) -> List[Optional[str]]:
+        """Write several PDF hyperlinks with a single workbook load and save.
+
+        Args:
+            excel_file: Path to the Excel file
+            sheet_name: Name of the sheet to update
+            filter2_col: Column name for the hyperlinks
+            links: (row_idx, pdf_path) pairs to write, row indices 0-based
+
+        Returns:
+            List[Optional[str]]: The original hyperlink of each written cell, in
+            the order of ``links``
+        """
         try:
             print(f"[DEBUG] Cache state before PDF link update - size: {len(self._hyperlink_cache)}")
             if not is_path_available(excel_file):
                 raise FileNotFoundError(f"Excel file not found or not accessible: {excel_file}")
 
-            if not is_path_available(pdf_path):
-                raise FileNotFoundError(f"PDF file not found or not accessible: {pdf_path}")
+            for _, pdf_path in links:
+                if not is_path_available(pdf_path):
+                    raise FileNotFoundError(f"PDF file not found or not accessible: {pdf_path}")
 
-            print(f"[DEBUG] Updating Excel link in {sheet_name}, row {row_idx + 2}, column {filter2_col}")
+            print(f"[DEBUG] Updating {len(links)} Excel link(s) in {sheet_name}, column {filter2_col}")
 
             wb = None
             backup_created = False
-            original_hyperlink = None
+            original_hyperlinks: List[Optional[str]] = []
 
             try:
                 wb = load_workbook(excel_file, data_only=False)
@@ -333,43 +355,55 @@ class ExcelManager:
                     raise ValueError(f"Column '{filter2_col}' not found in sheet '{sheet_name}'")
                 col_idx = header[filter2_col]
 
-                cell = ws.cell(row=row_idx + 2, column=col_idx)
-
-                if cell.hyperlink:
-                    original_hyperlink = cell.hyperlink.target
-                    print(f"[DEBUG] Found existing hyperlink: {original_hyperlink}")
-
                 if not backup_created:
                     backup_file = f"{excel_file}.bak"
                     copy2(excel_file, backup_file)
                     backup_created = True
                     print(f"[DEBUG] Backup created at {backup_file}")
 
-                relative_pdf_path = path.relpath(pdf_path, path.dirname(excel_file))
-                print(f"[DEBUG] Setting new hyperlink: {relative_pdf_path}")
+                excel_dir = path.dirname(excel_file)
+                for row_idx, pdf_path in links:
+                    cell = ws.cell(row=row_idx + 2, column=col_idx)
 
-                hyperlink = Hyperlink(
-                    ref=cell.coordinate,
-                    target=relative_pdf_path,
-                    display=cell.value,
-                )
-                cell.hyperlink = hyperlink
-                cell.style = 'Hyperlink'
+                    original_hyperlink = None
+                    if cell.hyperlink:
+                        original_hyperlink = cell.hyperlink.target
+                        print(f"[DEBUG] Found existing hyperlink: {original_hyperlink}")
+                    original_hyperlinks.append(original_hyperlink)
+
+                    relative_pdf_path = path.relpath(pdf_path, excel_dir)
+                    print(f"[DEBUG] Setting new hyperlink at row {row_idx + 2}: {relative_pdf_path}")
+
+                    hyperlink = Hyperlink(
+                        ref=cell.coordinate,
+                        target=relative_pdf_path,
+                        display=cell.value,
+                    )
+                    cell.hyperlink = hyperlink
+                    cell.style = 'Hyperlink'
 
                 print("[DEBUG] Saving workbook")
                 wb.save(excel_file)
+
+                # Only hyperlinks changed, so the loaded data is still current;
+                # record the new mtime to avoid reparsing the sheet on the next load
+                if self._cached_file == excel_file and self._cached_sheet == sheet_name:
+                    try:
+                        self._last_modified = path.getmtime(excel_file)
+                    except (OSError, PermissionError):
+                        self._last_modified = None
                 
-                # Update the hyperlink cache for this row
-                self._hyperlink_cache[row_idx] = True
-                print(f"[DEBUG] Updated hyperlink cache for row {row_idx} to True")
+                # Update the hyperlink cache for the written rows
+                for row_idx, _ in links:
+                    self._hyperlink_cache[row_idx] = True
                 print(f"[DEBUG] Cache state after PDF link update - size: {len(self._hyperlink_cache)}")
 
-                print(f"[DEBUG] Excel file updated with new hyperlink at row {row_idx + 2}, column {filter2_col}")
+                print(f"[DEBUG] Excel file updated with {len(links)} new hyperlink(s) in column {filter2_col}")
 
-                return original_hyperlink
+                return original_hyperlinks
 
             except Exception as e:
-                print(f"[DEBUG] Error in update_pdf_link: {str(e)}")
+                print(f"[DEBUG] Error in apply_pdf_link_batch: {str(e)}")
                 if wb:
                     try:
                         print("[DEBUG] Closing workbook without saving due to error")
@@ -390,7 +424,7 @@ class ExcelManager:
                     wb.close()
 
         except Exception as e:
-            print(f"[DEBUG] Error in update_pdf_link: {str(e)}")
+            print(f"[DEBUG] Error in apply_pdf_link_batch: {str(e)}")
             print(f"[DEBUG] Stack trace: {traceback.format_exc()}")
             raise Exception(f"Error updating Excel with PDF link: {str(e)}")
 
@@ -476,125 +510,21 @@ class ExcelManager:
             return []
         return list(self.excel_data.columns)
 
-    def find_matching_row(
-        self,
-        filter_columns: List[str],
-        filter_values: List[str],
-    ) -> Tuple[Optional[Series], Optional[int]]:
-        """Find a row matching the given filter values.
+    def set_hyperlink_status(
+        self, excel_file: str, sheet_name: str, row_idx: int, has_hyperlink: bool = True
+    ) -> None:
+        """Record a row's hyperlink status after another manager wrote it.
 
-        Args:
-            filter_columns: List of column names to filter on
-            filter_values: List of values to match in corresponding columns
+        Ignored unless this manager has the same file and sheet loaded.
 
-        Returns:
-            Tuple[Optional[Series], Optional[int]]: Matching row data and index if found
+        Args:
+            excel_file: Path to the Excel file that was updated
+            sheet_name: Name of the sheet that was updated
+            row_idx: The 0-based row index that was updated
+            has_hyperlink: The new hyperlink status for the row
         """
-        try:
-            if self.excel_data is None:
-                raise Exception("Excel data not loaded")
-
-            if len(filter_columns) != len(filter_values):
-                raise Exception(f"Number of filter columns ({len(filter_columns)}) and values ({len(filter_values)}) must match")
-
-            print(f"[DEBUG] Finding row with filters: {dict(zip(filter_columns, filter_values))}")
-
-            df = self.excel_data
-
-            def create_mask(col: str, value: str) -> Series:
-                """Create a boolean mask for filtering DataFrame."""
-                if col not in df.columns:
-                    raise Exception(f"Column '{col}' not found in Excel file. Available columns: {', '.join(df.columns)}")
-
-                print(f"[DEBUG] Creating mask for column '{col}' with value '{value}'")
-
-                # Make a copy of the column to avoid modifying the original
-                col_series = df[col].copy()
-
-                # Handle date columns
-                if "DATE" in col.upper():
-                    try:
-                        # Try to parse the date value with dayfirst=True for dd/mm/yyyy format
-                        print(f"[DEBUG] Attempting to parse date value '{value}' for column '{col}'")
-                        # First try explicit French format
-                        try:
-                            date_value = pd.to_datetime(value, format='%d/%m/%Y')
-                        except ValueError:  # For date parsing errors
-                            # Fallback to general parsing with dayfirst=True
-                            date_value = pd.to_datetime(value, dayfirst=True)
-                        
-                        print(f"[DEBUG] Successfully parsed input date: {date_value}")
-                        
-                        # Convert column to datetime if not already
-                        if not is_datetime64_any_dtype(col_series):
-                            # Try to parse column values with French format first
-                            try:
-                                col_series = pd.to_datetime(col_series, format='%d/%m/%Y', errors='coerce')
-                            except ValueError:  # For date parsing errors
-                                col_series = pd.to_datetime(col_series, dayfirst=True, errors='coerce')
-                            
-                        print(f"[DEBUG] Column conversion complete. Sample values: {col_series.head()}")
-                        return col_series.dt.normalize() == date_value.normalize()
-                        
-                    except Exception as e:
-                        print(f"[DEBUG] Date parsing failed for column '{col}': {str(e)}")
-                        print("[DEBUG] Falling back to string comparison")
-                        return col_series.astype(str).str.strip() == str(value).strip()
-                
-                # Handle numeric columns (for amount comparisons)
-                elif "MNT" in col.upper() or any(num_indicator in col.upper() for num_indicator in ["MONTANT", "NOMBRE", "NUM", "PRIX"]):
-                    try:
-                        # Clean and convert the input value
-                        num_str = str(value).replace(' ', '').replace(',', '.')
-                        target_value = float(num_str)
-                        
-                        # Convert column values with the same cleaning
-                        def clean_number(x):
-                            try:
-                                if pd.isna(x):
-                                    return None
-                                return float(str(x).replace(' ', '').replace(',', '.'))
-                            except (ValueError, TypeError):  # For number conversion errors
-                                return None
-                        
-                        col_series = col_series.apply(clean_number)
-                        return col_series == target_value
-                        
-                    except Exception as e:
-                        print(f"[DEBUG] Number parsing failed for column '{col}': {str(e)}")
-                        return col_series.astype(str).str.strip() == str(value).strip()
-                
-                # Default string comparison
-                else:
-                    return col_series.astype(str).str.strip() == str(value).strip()
-
-            # Create mask for each filter
-            masks = [create_mask(col, val) for col, val in zip(filter_columns, filter_values)]
-            
-            # Combine all masks with AND operation
-            final_mask = pd.Series([True] * len(df))
-            for mask in masks:
-                final_mask &= mask
-
-            matching_rows = df[final_mask]
-            print(f"[DEBUG] Found {len(matching_rows)} matching rows")
-
-            if len(matching_rows) == 0:
-                print("[DEBUG] No matching rows found")
-                return None, None
-            elif len(matching_rows) == 1:
-                row_idx = matching_rows.index[0]
-                print(f"[DEBUG] Found exactly one match at row index {row_idx}")
-                return matching_rows.iloc[0], row_idx
-            else:
-                # If multiple matches, return the first one
-                row_idx = matching_rows.index[0]
-                print(f"[DEBUG] Found multiple matches, using first match at row index {row_idx}")
-                return matching_rows.iloc[0], row_idx
-
-        except Exception as e:
-            print(f"[DEBUG] Error in find_matching_row: {str(e)}")
-            raise Exception(f"Error finding matching row: {str(e)}")
+        if self._cached_file == excel_file and self._cached_sheet == sheet_name:
+            self._hyperlink_cache[row_idx] = has_hyperlink
 
     def has_hyperlink(self, row_idx: int) -> bool:
         """Check if a row has any hyperlinks.
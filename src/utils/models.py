@@ -8,12 +8,13 @@ class PDFTask:
     task_id: str  # Unique identifier for the task
     pdf_path: str
     filter_values: List[str] = field(default_factory=list)  # Dynamic list of filter values
-    status: str = "pending"  # pending, processing, failed, completed, reverted, skipped
+    status: str = "pending"  # pending, processing, failed, link_failed, completed, reverted, skipped
     error_msg: str = ""
     row_idx: int = -1  # Add row index field
     original_excel_hyperlink: Optional[str] = None
     original_pdf_location: Optional[str] = None
     processed_pdf_location: Optional[str] = None
+    rotation: int = 0  # Rotation (0, 90, 180, 270) chosen when the task was queued
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
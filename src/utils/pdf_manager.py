@@ -1,30 +1,48 @@
 from os import path, makedirs, remove
-from os import listdir as os_listdir
-from shutil import copy2
+from os import scandir, stat as os_stat
+from shutil import copy2, move
 from tempfile import TemporaryDirectory
 from io import BytesIO
-from time import sleep
+from time import sleep, monotonic
+from threading import RLock
 import re
 from socket import timeout as SocketTimeout, getdefaulttimeout, setdefaulttimeout
 from fitz import open as fitz_open, Matrix
 from PIL.Image import open as pil_open
 from typing import List, Optional, Dict, Any, Tuple
-from win32file import MoveFileEx, MOVEFILE_REPLACE_EXISTING, MOVEFILE_COPY_ALLOWED
+try:
+    from win32file import MoveFileEx, MOVEFILE_REPLACE_EXISTING, MOVEFILE_COPY_ALLOWED
+except ImportError:
+    # pywin32 only exists on Windows; elsewhere (e.g. running the tests)
+    # files are moved with shutil.move
+    MoveFileEx = None
 from .excel_manager import is_path_available
 from .template_manager import TemplateManager
 from .models import PDFTask
 
+# Characters replaced with "_" in filter values used to build output paths
+_FILTER_VALUE_TRANS = str.maketrans(dict.fromkeys(r'<>:"/\|?*{}[]#%&$+!`=\';,@', "_"))
+
 class PDFManager:
     def __init__(self) -> None:
         self.current_file_index: int = -1
         self.current_file_list: List[str] = []
         self.cached_pdf: Optional[Any] = None
         self.cached_pdf_path: Optional[str] = None
+        # Guards the cached document, which the viewer's render worker, the
+        # processing workers and the UI thread can all open or close
+        self._cache_lock = RLock()
         self._network_timeout: int = 5  # 5 seconds timeout for network operations
         self._max_retries: int = 3  # Maximum number of retries for file operations
         self._retry_delay: int = 1  # Initial retry delay in seconds
         self.current_rotation: int = 0  # Track current rotation (0, 90, 180, 270)
         self.template_manager = TemplateManager()
+        # (folder, folder mtime in ns, scan time, PDF names oldest first) from
+        # the last scan
+        self._pdf_listing: Optional[Tuple[str, int, float, List[str]]] = None
+        # SMB clients cache directory metadata for ~10 s, so a listing is also
+        # rescanned once it is this old even if the folder mtime looks unchanged
+        self._pdf_listing_max_age: float = 10.0
 
     def _get_next_version_number(self, filepath: str) -> Tuple[str, int]:
         """
@@ -58,17 +76,13 @@ class PDFManager:
         """Generate output path using template and data."""
         try:
             # Sanitize filter values to handle path characters
-            invalid_chars = r'<>:"/\|?*{}[]#%&$+!`=\';,@'
             sanitized_data = data.copy()
 
             # Only sanitize filter values, not the processed_folder
             for key in data:
                 if key.startswith("filter") and isinstance(data[key], str):
-                    # Replace invalid characters with underscores
-                    value = data[key]
-                    for char in invalid_chars:
-                        value = value.replace(char, "_")
-                    sanitized_data[key] = value
+                    # Replace invalid characters with underscores in one pass
+                    sanitized_data[key] = data[key].translate(_FILTER_VALUE_TRANS)
 
             # Process the template
             filepath = self.template_manager.process_template(template, sanitized_data)
@@ -95,14 +109,18 @@ class PDFManager:
         template_data: Dict[str, Any],
         processed_folder: str,
         output_template: str,
-    ) -> bool:
-        """Process a PDF file using template-based naming."""
+    ) -> str:
+        """Process a PDF file using template-based naming.
+
+        Returns:
+            str: The path the PDF was moved to
+        """
         print(f"[DEBUG] Starting PDF processing for file: {task.pdf_path}")
         print(f"[DEBUG] File exists check: {path.exists(task.pdf_path)}")
         
         if not path.exists(task.pdf_path):
             print(f"[DEBUG] PDF not found at path: {task.pdf_path}")
-            raise Exception("Source PDF file not found")
+            raise FileNotFoundError("Source PDF file not found")
 
         if not path.exists(processed_folder):
             print(f"[DEBUG] Creating processed folder: {processed_folder}")
@@ -165,12 +183,13 @@ class PDFManager:
                             "Failed to create backup copy after multiple attempts"
                         )
 
-                    # Apply rotation if needed
-                    if self.current_rotation != 0:
-                        print(f"[DEBUG] Applying rotation: {self.current_rotation} degrees")
+                    # Apply the rotation captured with the task; the viewer's
+                    # current rotation may already belong to the next PDF
+                    if task.rotation != 0:
+                        print(f"[DEBUG] Applying rotation: {task.rotation} degrees")
                         doc = fitz_open(temp_pdf)
                         page = doc[0]  # Assuming single page PDFs
-                        page.set_rotation(self.current_rotation)
+                        page.set_rotation(task.rotation)
                         doc.save(rotated_pdf)
                         doc.close()
                         temp_pdf = rotated_pdf
@@ -189,21 +208,21 @@ class PDFManager:
 
                         print(f"[DEBUG] Moving file: {temp_pdf} -> {new_filepath}")
                         # Use windows-specific move operation
-                        MoveFileEx(
-                            temp_pdf,
-                            new_filepath,
-                            MOVEFILE_REPLACE_EXISTING | MOVEFILE_COPY_ALLOWED,
-                        )
+                        if MoveFileEx is not None:
+                            MoveFileEx(
+                                temp_pdf,
+                                new_filepath,
+                                MOVEFILE_REPLACE_EXISTING | MOVEFILE_COPY_ALLOWED,
+                            )
+                        else:
+                            move(temp_pdf, new_filepath)
                         print("[DEBUG] File moved successfully")
 
                         print(f"[DEBUG] Removing original file: {task.pdf_path}")
                         # Explicitly remove the source file after successful move
                         remove(task.pdf_path)
                         print("[DEBUG] Original file removed successfully")
-
-                        # Reset rotation tracking
-                        self.current_rotation = 0
-                        return True
+                        return new_filepath
 
                     except Exception as move_error:
                         print(f"[DEBUG] Error during move operation: {str(move_error)}")
@@ -258,39 +277,36 @@ class PDFManager:
             setdefaulttimeout(self._network_timeout)
             
             try:
-                # Get all PDF files and sort by creation time (oldest first)
-                pdf_files = []
-                for f in os_listdir(source_folder):
-                    if f.lower().endswith(".pdf"):
-                        full_path = path.join(source_folder, f)
-                        try:
-                            creation_time = path.getctime(full_path)
-                            pdf_files.append((creation_time, f))
-                        except OSError:
-                            # Skip files that can't be accessed
-                            continue
-                
-                # Sort by creation time
-                pdf_files.sort()  # Will sort by creation_time since it's first element
-                pdf_files = [f for _, f in pdf_files]  # Extract just the filenames
-                
-                # Filter out files that are currently being processed
+                active_files = set()
                 if active_tasks:
                     active_files = {
                         path.basename(task.pdf_path)
                         for task in active_tasks.values()
                         if task.status in ["pending", "processing"]
                     }
-                    pdf_files = [f for f in pdf_files if f not in active_files]
+
+                # Filter out files that are currently being processed
+                pdf_files = [
+                    f for f in self._list_pdfs(source_folder) if f not in active_files
+                ]
+                if active_files:
                     print(f"[DEBUG] Filtered out {len(active_files)} active files from next file selection")
 
+                # Get the oldest file that still exists; the listing may be stale
+                # (e.g. cached SMB metadata), so a miss also drops it for next time
+                next_pdf = None
+                for pdf_file in pdf_files:
+                    candidate = path.join(source_folder, pdf_file)
+                    if path.exists(candidate):
+                        next_pdf = candidate
+                        break
+                    print(f"[DEBUG] Listed PDF no longer exists: {candidate}")
+                    self._pdf_listing = None
+
                 # If no files available after filtering
-                if not pdf_files:
+                if next_pdf is None:
                     return None
 
-                # Get the oldest file (first in sorted list)
-                next_pdf = path.join(source_folder, pdf_files[0])
-                
                 # Clear cache if different file
                 if next_pdf != self.cached_pdf_path:
                     self.clear_cache()
@@ -307,12 +323,53 @@ class PDFManager:
                 raise Exception("Network timeout while accessing PDF file")
             raise Exception(f"Error accessing PDF folder: {str(e)}")
 
+    def _list_pdfs(self, source_folder: str) -> List[str]:
+        """Get the PDF file names in a folder, oldest first.
+
+        The listing is kept until the folder's modification time changes,
+        which happens whenever a file is added, removed or renamed in it, or
+        until it is _pdf_listing_max_age seconds old.
+
+        Args:
+            source_folder: The folder to scan for PDFs
+
+        Returns:
+            List[str]: PDF file names sorted by creation time
+        """
+        folder_mtime = os_stat(source_folder).st_mtime_ns
+        listing = self._pdf_listing
+        if (
+            listing is not None
+            and listing[:2] == (source_folder, folder_mtime)
+            and monotonic() - listing[2] < self._pdf_listing_max_age
+        ):
+            return listing[3]
+        scanned_at = monotonic()
+
+        # scandir entries carry their stat data, so no extra call per file
+        pdf_files = []
+        with scandir(source_folder) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".pdf"):
+                    try:
+                        pdf_files.append((entry.stat().st_ctime, entry.name))
+                    except OSError:
+                        # Skip files that can't be accessed
+                        continue
+
+        # Sort by creation time
+        pdf_files.sort()
+        names = [f for _, f in pdf_files]
+        self._pdf_listing = (source_folder, folder_mtime, scanned_at, names)
+        return names
+
     def clear_cache(self):
         """Clear the cached PDF document."""
-        if self.cached_pdf:
-            self.cached_pdf.close()
-            self.cached_pdf = None
-            self.cached_pdf_path = None
+        with self._cache_lock:
+            if self.cached_pdf:
+                self.cached_pdf.close()
+                self.cached_pdf = None
+                self.cached_pdf_path = None
 
     def rotate_page(self, clockwise=True):
         """Rotate the current PDF page clockwise or counterclockwise by 90 degrees."""
@@ -335,18 +392,23 @@ class PDFManager:
             int: Total number of pages in the PDF
         """
         try:
-            # Check if we need to load a new PDF
-            if self.cached_pdf_path != pdf_path:
-                self.clear_cache()
-                self.cached_pdf = fitz_open(pdf_path)
-                self.cached_pdf_path = pdf_path
+            with self._cache_lock:
+                # Check if we need to load a new PDF
+                if self.cached_pdf_path != pdf_path:
+                    self.clear_cache()
+                    self.cached_pdf = fitz_open(pdf_path)
+                    self.cached_pdf_path = pdf_path
 
-            return len(self.cached_pdf)
+                return len(self.cached_pdf)
         except Exception as e:
             raise Exception(f"Error getting PDF page count: {str(e)}")
 
     def render_pdf_page(
-        self, pdf_path: str, zoom: float = 1.0, page: int = 1
+        self,
+        pdf_path: str,
+        zoom: float = 1.0,
+        page: int = 1,
+        rotation: Optional[int] = None,
     ) -> Any:
         """Render a specific page of a PDF file.
 
@@ -354,44 +416,50 @@ class PDFManager:
             pdf_path: Path to the PDF file
             zoom: Zoom level for rendering
             page: Page number to render (1-based index)
+            rotation: Rotation of the first page in degrees, defaults to the
+                current rotation
 
         Returns:
             PIL.Image: Rendered page as a PIL Image
         """
         try:
-            # Check if we need to load a new PDF
-            if self.cached_pdf_path != pdf_path:
-                self.clear_cache()
-                self.cached_pdf = fitz_open(pdf_path)
-                self.cached_pdf_path = pdf_path
-
-            # Convert 1-based page index to 0-based
-            page_idx = page - 1
-            if page_idx < 0 or page_idx >= len(self.cached_pdf):
-                raise ValueError(f"Invalid page number: {page}. PDF has {len(self.cached_pdf)} pages.")
-
-            # Get the page
-            pdf_page = self.cached_pdf[page_idx]
-
-            # Calculate zoom matrix and apply rotation for first page if needed
-            if page_idx == 0 and self.current_rotation != 0:
-                # For rotation: Matrix(cos(angle), -sin(angle), sin(angle), cos(angle), 0, 0)
-                rad = self.current_rotation * 3.14159265359 / 180  # convert degrees to radians
-                from math import sin, cos
-                zoom_matrix = Matrix(
-                    cos(rad) * zoom, -sin(rad) * zoom,  # a, b
-                    sin(rad) * zoom, cos(rad) * zoom,   # c, d
-                    0, 0                                # e, f
-                )
-            else:
-                zoom_matrix = Matrix(zoom, zoom)
-
-            # Get the pixmap
-            pix = pdf_page.get_pixmap(matrix=zoom_matrix)
-
-            # Convert to PIL Image
-            img_data = BytesIO(pix.tobytes("png"))
-            return pil_open(img_data)
+            with self._cache_lock:
+                # Check if we need to load a new PDF
+                if self.cached_pdf_path != pdf_path:
+                    self.clear_cache()
+                    self.cached_pdf = fitz_open(pdf_path)
+                    self.cached_pdf_path = pdf_path
+
+                # Convert 1-based page index to 0-based
+                page_idx = page - 1
+                if page_idx < 0 or page_idx >= len(self.cached_pdf):
+                    raise ValueError(f"Invalid page number: {page}. PDF has {len(self.cached_pdf)} pages.")
+
+                # Get the page
+                pdf_page = self.cached_pdf[page_idx]
+
+                if rotation is None:
+                    rotation = self.current_rotation
+
+                # Calculate zoom matrix and apply rotation for first page if needed
+                if page_idx == 0 and rotation != 0:
+                    # For rotation: Matrix(cos(angle), -sin(angle), sin(angle), cos(angle), 0, 0)
+                    rad = rotation * 3.14159265359 / 180  # convert degrees to radians
+                    from math import sin, cos
+                    zoom_matrix = Matrix(
+                        cos(rad) * zoom, -sin(rad) * zoom,  # a, b
+                        sin(rad) * zoom, cos(rad) * zoom,   # c, d
+                        0, 0                                # e, f
+                    )
+                else:
+                    zoom_matrix = Matrix(zoom, zoom)
+
+                # Get the pixmap
+                pix = pdf_page.get_pixmap(matrix=zoom_matrix)
+
+                # Convert to PIL Image
+                img_data = BytesIO(pix.tobytes("png"))
+                return pil_open(img_data)
 
         except Exception as e:
             raise Exception(f"Error rendering PDF page: {str(e)}")
@@ -2,6 +2,23 @@ from datetime import datetime
 from re import sub, Match
 from typing import Any, Dict, Optional, Callable, Union
 
+# Characters that are problematic in file paths and what sanitize_path uses instead
+_PATH_CHAR_TRANS = str.maketrans({
+    '/': '_',    # Forward slash
+    '\\': '_',   # Backslash
+    ':': '-',    # Colon
+    '*': '+',    # Asterisk
+    '?': '',     # Question mark
+    '"': "'",    # Double quote
+    '<': '(',    # Less than
+    '>': ')',    # Greater than
+    '|': '-',    # Pipe
+    '\0': '',    # Null character
+    '\n': ' ',   # Newline
+    '\r': ' ',   # Carriage return
+    '\t': ' ',   # Tab
+})
+
 class TemplateManager:
     """Manages template parsing and processing with support for various operations."""
     
@@ -16,25 +33,8 @@ class TemplateManager:
         def sanitize_path(s: str) -> str:
             """Sanitize a string to be safe for use in file paths.
             Handles various special characters while preserving basic readability."""
-            # Characters that are problematic in file paths
-            replacements = {
-                '/': '_',    # Forward slash
-                '\\': '_',   # Backslash
-                ':': '-',    # Colon
-                '*': '+',    # Asterisk
-                '?': '',     # Question mark
-                '"': "'",    # Double quote
-                '<': '(',    # Less than
-                '>': ')',    # Greater than
-                '|': '-',    # Pipe
-                '\0': '',    # Null character
-                '\n': ' ',   # Newline
-                '\r': ' ',   # Carriage return
-                '\t': ' ',   # Tab
-            }
-            result = s
-            for char, replacement in replacements.items():
-                result = result.replace(char, replacement)
+            # Replace problematic characters in a single pass
+            result = s.translate(_PATH_CHAR_TRANS)
             # Remove any leading/trailing whitespace and dots
             result = result.strip('. ')
             # Collapse multiple spaces into one
@@ -0,0 +1,74 @@
+from os import path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from src.utils import ExcelManager
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    excel_file = tmp_path / "book.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["NAME", "REF"])
+    ws.append(["first", "R-1"])
+    ws.append(["second", "R-2"])
+    ws.append(["third", "R-3"])
+    ws["B3"].hyperlink = Hyperlink(ref="B3", target="old/second.pdf")
+    wb.save(excel_file)
+    return excel_file
+
+
+@pytest.fixture
+def pdfs(tmp_path):
+    folder = tmp_path / "processed"
+    folder.mkdir()
+    files = []
+    for name in ("first.pdf", "second.pdf"):
+        pdf = folder / name
+        pdf.write_bytes(b"%PDF-1.4\n")
+        files.append(str(pdf))
+    return files
+
+
+def test_apply_pdf_link_batch_writes_all_links_in_one_save(workbook, pdfs):
+    manager = ExcelManager()
+
+    originals = manager.apply_pdf_link_batch(
+        str(workbook), "Sheet1", "REF", [(0, pdfs[0]), (1, pdfs[1])]
+    )
+
+    assert originals == [None, "old/second.pdf"]
+    ws = load_workbook(workbook)["Sheet1"]
+    excel_dir = path.dirname(str(workbook))
+    assert ws["B2"].hyperlink.target == path.relpath(pdfs[0], excel_dir)
+    assert ws["B3"].hyperlink.target == path.relpath(pdfs[1], excel_dir)
+    assert ws["B2"].value == "R-1"  # Cell text is kept
+    assert ws["B4"].hyperlink is None
+    assert manager.has_hyperlink(0) and manager.has_hyperlink(1)
+    assert not manager.has_hyperlink(2)
+    assert path.exists(f"{workbook}.bak")
+
+
+def test_apply_pdf_link_batch_keeps_loaded_data_current(workbook, pdfs):
+    manager = ExcelManager()
+    assert manager.load_excel_data(str(workbook), "Sheet1")
+
+    manager.apply_pdf_link_batch(str(workbook), "Sheet1", "REF", [(2, pdfs[0])])
+
+    # Only hyperlinks changed, so the sheet is not parsed again
+    assert not manager.load_excel_data(str(workbook), "Sheet1")
+
+
+def test_apply_pdf_link_batch_rejects_unknown_columns(workbook, pdfs):
+    before = workbook.read_bytes()
+
+    with pytest.raises(Exception, match="MISSING"):
+        ExcelManager().apply_pdf_link_batch(
+            str(workbook), "Sheet1", "MISSING", [(0, pdfs[0])]
+        )
+
+    assert workbook.read_bytes() == before
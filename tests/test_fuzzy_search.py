@@ -0,0 +1,58 @@
+import random
+import string
+
+from src.ui.fuzzy_search import _rank_matches, _similarity
+
+
+def _rank_without_prefilter(search_lower, values, threshold):
+    """The ranking before the length prefilter: score every value."""
+    scored = []
+    for value in values:
+        value_lower = value.lower()
+        if value_lower == search_lower:
+            ratio = 100
+        elif value_lower.startswith(search_lower):
+            ratio = max(_similarity(search_lower, value_lower), 90)
+        elif search_lower in value_lower:
+            ratio = max(_similarity(search_lower, value_lower), 80)
+        elif any(word.startswith(search_lower) for word in value_lower.split()):
+            ratio = max(_similarity(search_lower, value_lower), 75)
+        else:
+            ratio = _similarity(search_lower, value_lower)
+        if ratio >= threshold:
+            scored.append((ratio, value))
+    scored.sort(reverse=True, key=lambda x: x[0])
+    return [value for _, value in scored]
+
+
+def _rank(search, values, threshold=65):
+    return _rank_matches(
+        search.lower(), values, [value.lower() for value in values], threshold
+    )
+
+
+def test_special_matches_rank_above_fuzzy_ones():
+    values = ["Invoice 2024", "Acme Invoice", "invoice", "Invoices", "Involve"]
+
+    assert _rank("invoice", values) == [
+        "invoice",
+        "Invoices",
+        "Invoice 2024",
+        "Acme Invoice",
+        "Involve",
+    ]
+
+
+def test_length_prefilter_keeps_results_and_order():
+    rng = random.Random(1234)
+    alphabet = string.ascii_lowercase[:6] + " "
+    values = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 30)))
+        for _ in range(400)
+    ]
+    for threshold in (0, 30, 65, 90, 100):
+        for _ in range(25):
+            search = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            assert _rank(search, values, threshold) == _rank_without_prefilter(
+                search.lower(), values, threshold
+            )
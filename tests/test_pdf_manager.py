@@ -0,0 +1,89 @@
+import os
+import time
+from time import monotonic
+
+from src.utils import PDFManager
+from src.utils.pdf_manager import _FILTER_VALUE_TRANS
+
+_INVALID_CHARS = r'<>:"/\|?*{}[]#%&$+!`=\';,@'
+
+
+def _replace_chain(value):
+    """The per-character replace loop _FILTER_VALUE_TRANS replaced."""
+    for char in _INVALID_CHARS:
+        value = value.replace(char, "_")
+    return value
+
+
+def test_filter_value_translation_matches_the_replace_chain():
+    samples = [
+        "",
+        "plain value",
+        "N°12/2024",
+        'a<b>c:d"e/f\\g|h?i*j{k}l[m]n#o%p&q$r+s!t`u=v\'w;x,y@z',
+        _INVALID_CHARS * 2,
+        "été_ünïcode – dash",
+    ]
+    for value in samples:
+        assert value.translate(_FILTER_VALUE_TRANS) == _replace_chain(value)
+
+
+def _touch(folder, name):
+    path = folder / name
+    path.write_bytes(b"%PDF-1.4\n")
+    time.sleep(0.01)  # Distinct creation times
+    return path
+
+
+def test_list_pdfs_lists_pdfs_oldest_first(tmp_path):
+    _touch(tmp_path, "b.pdf")
+    _touch(tmp_path, "notes.txt")
+    _touch(tmp_path, "A.PDF")
+    _touch(tmp_path, "c.pdf")
+
+    assert PDFManager()._list_pdfs(str(tmp_path)) == ["b.pdf", "A.PDF", "c.pdf"]
+
+
+def test_list_pdfs_reuses_the_listing_until_the_folder_changes(tmp_path):
+    manager = PDFManager()
+    _touch(tmp_path, "a.pdf")
+    listing = manager._list_pdfs(str(tmp_path))
+    assert manager._list_pdfs(str(tmp_path)) is listing
+
+    _touch(tmp_path, "b.pdf")
+    stat = os.stat(tmp_path)
+    # Make sure the folder mtime moved even on coarse-grained filesystems
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert manager._list_pdfs(str(tmp_path)) == ["a.pdf", "b.pdf"]
+
+
+def test_list_pdfs_rescans_old_listings(tmp_path):
+    manager = PDFManager()
+    _touch(tmp_path, "a.pdf")
+    folder_mtime = os.stat(tmp_path).st_mtime_ns
+    # A listing whose folder mtime still matches but that was taken too long ago
+    manager._pdf_listing = (str(tmp_path), folder_mtime, monotonic() - 60, [])
+
+    assert manager._list_pdfs(str(tmp_path)) == ["a.pdf"]
+
+
+def test_get_next_pdf_skips_listed_files_that_are_gone(tmp_path):
+    manager = PDFManager()
+    _touch(tmp_path, "b.pdf")
+    folder_mtime = os.stat(tmp_path).st_mtime_ns
+    # Stale listing, as left by cached SMB directory metadata
+    manager._pdf_listing = (str(tmp_path), folder_mtime, monotonic(), ["a.pdf", "b.pdf"])
+
+    assert manager.get_next_pdf(str(tmp_path)) == str(tmp_path / "b.pdf")
+    assert manager._pdf_listing is None
+
+
+def test_get_next_pdf_skips_active_tasks(tmp_path):
+    from src.utils import PDFTask
+
+    manager = PDFManager()
+    first = _touch(tmp_path, "a.pdf")
+    _touch(tmp_path, "b.pdf")
+    active = {str(first): PDFTask(task_id="1", pdf_path=str(first), status="processing")}
+
+    assert manager.get_next_pdf(str(tmp_path), active) == str(tmp_path / "b.pdf")
@@ -0,0 +1,217 @@
+from datetime import datetime
+
+import pandas as pd
+
+from src.ui.processing_tab import (
+    _LAST_DATE_FORMAT,
+    ProcessingQueue,
+    _format_filter_values,
+    _parse_date_string,
+)
+from src.utils import ExcelManager, PDFManager, PDFTask
+
+
+def test_date_column_values_are_formatted_day_first():
+    series = pd.Series(
+        [datetime(2024, 3, 15), datetime(2024, 1, 2), datetime(2024, 3, 15), pd.NaT]
+    )
+    assert series.dtype.kind == "M"
+
+    assert _format_filter_values(series, True) == ("02/01/2024", "15/03/2024")
+
+
+def test_date_column_text_values_are_kept_when_unparseable():
+    series = pd.Series(["15/03/2024", " pending ", None])
+
+    assert _format_filter_values(series, True) == ("15/03/2024", "pending")
+
+
+def test_other_columns_are_stripped_and_deduplicated():
+    series = pd.Series([" B ", "A", "A", " B "], dtype="category")
+
+    assert _format_filter_values(series, False) == ("A", "B")
+
+
+# Date parsing
+
+def test_parse_date_string_accepts_each_configured_format():
+    key = ("book.xlsx", "Sheet1", "INVOICE DATE")
+    for value in ("15/03/2024", "15-03-2024", "2024-03-15", "2024/03/15"):
+        assert _parse_date_string(value, key) == datetime(2024, 3, 15)
+
+
+def test_parse_date_string_rejects_other_layouts():
+    key = ("book.xlsx", "Sheet1", "DUE DATE")
+    assert _parse_date_string("March 15, 2024", key) is None
+    assert _parse_date_string("15.03.2024", key) is None
+    assert _parse_date_string("2024-13-01", key) is None
+
+
+def test_parse_date_string_remembers_the_last_format_per_column():
+    key = ("book.xlsx", "Sheet1", "PAYMENT DATE")
+    other_key = ("book.xlsx", "Sheet1", "OTHER DATE")
+    _LAST_DATE_FORMAT.pop(key, None)
+    _LAST_DATE_FORMAT.pop(other_key, None)
+
+    assert _parse_date_string("2024/03/15", key) == datetime(2024, 3, 15)
+    assert _LAST_DATE_FORMAT[key] == "%Y/%m/%d"
+    assert other_key not in _LAST_DATE_FORMAT
+
+    # The remembered format is tried first but the others still apply
+    assert _parse_date_string("16/03/2024", key) == datetime(2024, 3, 16)
+    assert _LAST_DATE_FORMAT[key] == "%d/%m/%Y"
+
+
+# ProcessingQueue status buckets
+
+class _ConfigManager:
+    def __init__(self):
+        self.callbacks = []
+
+    def add_change_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def get_config(self):
+        return {}
+
+
+def _make_queue(monkeypatch, excel_factory=None):
+    queue = ProcessingQueue(
+        _ConfigManager(),
+        ExcelManager(),
+        PDFManager(),
+        max_workers=1,
+        excel_factory=excel_factory,
+    )
+    # Keep tasks on the feed instead of handing them to worker threads
+    monkeypatch.setattr(queue, "_ensure_processing", lambda: None)
+    return queue
+
+
+def _task(pdf_path, status="pending", **kwargs):
+    return PDFTask(task_id="", pdf_path=pdf_path, status=status, **kwargs)
+
+
+def test_status_counts_follow_task_changes(monkeypatch):
+    queue = _make_queue(monkeypatch)
+    first, second, skipped = _task("a.pdf"), _task("b.pdf"), _task("c.pdf", "skipped")
+    queue.add_task(first)
+    queue.add_task(second)
+    queue.add_skipped_task(skipped)
+
+    total, counts = queue.get_status_counts()
+    assert total == 3
+    assert counts["pending"] == 2
+    assert counts["skipped"] == 1
+
+    queue.update_task_status(first.task_id, "completed")
+    queue.update_task_status(second.task_id, "failed")
+    total, counts = queue.get_status_counts()
+    assert (counts["pending"], counts["completed"], counts["failed"]) == (0, 1, 1)
+    assert queue.get_task_status()["completed"] == [first]
+
+    queue.clear_completed()
+    total, counts = queue.get_status_counts()
+    assert total == 2
+    assert counts["completed"] == 0
+    assert queue.drain_changes()["a.pdf"] is None
+
+
+def test_add_task_replaces_the_task_for_the_same_pdf(monkeypatch):
+    queue = _make_queue(monkeypatch)
+    old = _task("a.pdf")
+    queue.add_task(old)
+    queue.update_task_status(old.task_id, "failed")
+    queue.add_task(_task("a.pdf"))
+
+    total, counts = queue.get_status_counts()
+    assert total == 1
+    assert (counts["pending"], counts["failed"]) == (1, 0)
+
+
+def test_retry_failed_requeues_moves_and_rewrites_only_failed_links(monkeypatch):
+    queue = _make_queue(monkeypatch)
+    failed = _task("a.pdf", "failed", error_msg="boom")
+    link_failed = _task("b.pdf", "link_failed", error_msg="locked")
+    key = ("book.xlsx", "Sheet1", "REF")
+    with queue.lock:
+        queue._store_task(failed)
+        queue._store_task(link_failed)
+        queue._failed_excel_writes["b.pdf"] = (link_failed, "out/b.pdf", key)
+    link_writes = []
+    monkeypatch.setattr(
+        queue, "_queue_excel_link", lambda *args: link_writes.append(args)
+    )
+
+    queue.retry_failed()
+
+    assert (failed.status, failed.error_msg) == ("pending", "")
+    assert (link_failed.status, link_failed.error_msg) == ("processing", "")
+    # Only the failed move goes back to the workers
+    assert queue._pending.get_nowait() is failed
+    assert queue._pending.empty()
+    # The already-moved PDF only gets its hyperlink written again
+    assert link_writes == [(link_failed, "out/b.pdf", *key)]
+    assert queue._failed_excel_writes == {}
+    _, counts = queue.get_status_counts()
+    assert (counts["pending"], counts["processing"]) == (1, 1)
+    assert (counts["failed"], counts["link_failed"]) == (0, 0)
+
+
+class _LinkWriter:
+    def __init__(self, error=None):
+        self.error = error
+        self.batches = []
+
+    def apply_pdf_link_batch(self, excel_file, sheet_name, filter2_col, links):
+        if self.error is not None:
+            raise self.error
+        self.batches.append((excel_file, sheet_name, filter2_col, links))
+        return ["old.pdf"] * len(links)
+
+
+def _queue_links(queue, tasks):
+    for row_idx, task in enumerate(tasks):
+        task.row_idx = row_idx
+        with queue.lock:
+            queue._store_task(task)
+            queue._set_status(task, "processing")
+        queue._queue_excel_link(task, f"out/{task.pdf_path}", "book.xlsx", "Sheet1", "REF")
+
+
+def test_flush_writes_each_workbook_once_and_completes_tasks(monkeypatch):
+    writer = _LinkWriter()
+    queue = _make_queue(monkeypatch, excel_factory=lambda: writer)
+    tasks = [_task("a.pdf"), _task("b.pdf")]
+    _queue_links(queue, tasks)
+
+    queue._flush_excel_writes()
+
+    assert writer.batches == [
+        ("book.xlsx", "Sheet1", "REF", [(0, "out/a.pdf"), (1, "out/b.pdf")])
+    ]
+    assert [task.status for task in tasks] == ["completed", "completed"]
+    assert tasks[0].original_excel_hyperlink == "old.pdf"
+    assert queue.drain_hyperlink_updates() == [
+        ("book.xlsx", "Sheet1", 0),
+        ("book.xlsx", "Sheet1", 1),
+    ]
+    assert queue.drain_hyperlink_updates() == []
+
+
+def test_failed_link_batch_marks_tasks_link_failed(monkeypatch):
+    writer = _LinkWriter(error=OSError("workbook is locked"))
+    queue = _make_queue(monkeypatch, excel_factory=lambda: writer)
+    task = _task("a.pdf")
+    _queue_links(queue, [task])
+
+    queue._flush_excel_writes()
+
+    assert task.status == "link_failed"
+    assert "workbook is locked" in task.error_msg
+    assert queue._failed_excel_writes["a.pdf"] == (
+        task,
+        "out/a.pdf",
+        ("book.xlsx", "Sheet1", "REF"),
+    )
+    assert queue.drain_hyperlink_updates() == []
@@ -0,0 +1,42 @@
+from src.utils.template_manager import _PATH_CHAR_TRANS, TemplateManager
+
+# The replacements sanitize_path applied one str.replace at a time
+_REPLACEMENTS = {
+    "/": "_",
+    "\\": "_",
+    ":": "-",
+    "*": "+",
+    "?": "",
+    '"': "'",
+    "<": "(",
+    ">": ")",
+    "|": "-",
+    "\0": "",
+    "\n": " ",
+    "\r": " ",
+    "\t": " ",
+}
+
+
+def _replace_chain(value):
+    for char, replacement in _REPLACEMENTS.items():
+        value = value.replace(char, replacement)
+    return value
+
+
+def test_path_translation_matches_the_replace_chain():
+    samples = [
+        "",
+        "Invoice 12/2024: paid?",
+        'a/b\\c:d*e?f"g<h>i|j\0k\nl\rm\tn',
+        "".join(_REPLACEMENTS) * 3,
+        "N°42 – été",
+    ]
+    for value in samples:
+        assert value.translate(_PATH_CHAR_TRANS) == _replace_chain(value)
+
+
+def test_sanitize_strips_and_collapses_whitespace():
+    sanitize = TemplateManager().string_operations["sanitize"]
+
+    assert sanitize(" .Report: 2024/03\t\tdraft?. ") == "Report- 2024_03 draft"